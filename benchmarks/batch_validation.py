@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+Record validation throughput of validate_records, in process and on a
+process pool, next to calling the scalar validation functions in a loop.
+"""
+import random
+import sys
+import time
+
+from white_box.batch_validation import CHECKS, validate_records
+from white_box.class_exercises import (
+    validate_credit_card,
+    validate_date,
+    validate_email,
+    validate_login,
+    validate_password,
+    validate_url,
+)
+
+RECORDS = 200_000
+
+
+def make_records(count, seed=0):
+    """Returns count signup records, about half of them with invalid fields."""
+    rng = random.Random(seed)
+    return [
+        {
+            "username": rng.choice(["jdoe123", "joe", "alice_smith"]),
+            "password": rng.choice(["Secret#123", "password", "Pa55word!"]),
+            "email": rng.choice(["user@example.com", "user@", "a.b@c.org"]),
+            "card_number": rng.choice(["1234567890123", "12ab"]),
+            "url": rng.choice(["https://example.com", "ftp://x", "http://a.b/c"]),
+            "year": rng.randint(1890, 2110),
+            "month": rng.randint(0, 13),
+            "day": rng.randint(0, 32),
+        }
+        for _ in range(count)
+    ]
+
+
+def scalar_loop(records):
+    """Calls every scalar validation function on every record."""
+    for record in records:
+        validate_password(record["password"])
+        validate_email(record["email"])
+        validate_credit_card(record["card_number"])
+        validate_url(record["url"])
+        validate_login(record["username"], record["password"])
+        validate_date(record["year"], record["month"], record["day"])
+
+
+def main(count=RECORDS, workers=2):
+    """Prints the records per second of the scalar loop and of each mode."""
+    records = make_records(count)
+    checks = [name for name, _, _ in CHECKS]
+    for name, run in (
+        ("scalar loop", lambda: scalar_loop(records)),
+        ("batch", lambda: validate_records(records, checks)),
+        (
+            f"{workers} workers",
+            lambda: validate_records(records, checks, workers=workers),
+        ),
+    ):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>12}: {elapsed:8.3f}s, {count / elapsed:12.0f} records/s")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2,
+    )
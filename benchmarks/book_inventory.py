@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""
+Stock movement throughput of BookInventory: single sell and restock calls,
+and batches through apply_movements.
+"""
+import random
+import sys
+import time
+
+from benchmarks.book_store_lookup import make_books
+from white_box.book_inventory import BookInventory
+from white_box.book_store import BookStore
+
+BOOKS = 100_000
+MOVEMENTS = 1_000_000
+BATCH_SIZE = 10_000
+
+
+def make_inventory(size):
+    """Returns an inventory over size books with 1000 units each."""
+    books = make_books(size)
+    for book in books:
+        book.quantity = 1000
+    book_store = BookStore()
+    book_store.add_books(books)
+    return BookInventory(book_store)
+
+
+def main(movements=MOVEMENTS, size=BOOKS):
+    """Prints the movements per second of each API."""
+    rng = random.Random(0)
+    rows = [rng.randrange(size) for _ in range(movements)]
+
+    inventory = make_inventory(size)
+    start = time.perf_counter()
+    for number, row in enumerate(rows):
+        if number % 2:
+            inventory.restock(row, 1)
+        else:
+            inventory.sell(row)
+    single = movements / (time.perf_counter() - start)
+
+    inventory = make_inventory(size)
+    deltas = [(row, 1 if number % 2 else -1) for number, row in enumerate(rows)]
+    start = time.perf_counter()
+    for first in range(0, movements, BATCH_SIZE):
+        inventory.apply_movements(deltas[first : first + BATCH_SIZE])
+    batched = movements / (time.perf_counter() - start)
+
+    print(f"{movements} movements over {size} books")
+    print(f"      sell/restock: {single:>10.0f} movements/s")
+    print(f"   apply_movements: {batched:>10.0f} movements/s ({BATCH_SIZE} per batch)")
+
+
+if __name__ == "__main__":
+    main(*[int(argument) for argument in sys.argv[1:3]])
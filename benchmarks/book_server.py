@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+Search latency of BookServer under many concurrent clients. The server runs
+in a child process and measure_latency opens every client connection from
+this one, so each process holds one socket per client.
+"""
+import asyncio
+import multiprocessing
+import resource
+import sys
+import time
+
+from benchmarks.book_store_lookup import make_books
+from white_box.book_server import AsyncBookStore, BookServer, measure_latency
+from white_box.book_store import Book
+from white_box.book_store_concurrent import ConcurrentBookStore
+
+CLIENTS = 10_000
+REQUESTS_PER_CLIENT = 10
+BOOKS = 100_000
+
+
+def raise_file_limit():
+    """Raises the open files soft limit to the hard limit."""
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def run_server(books, ports):
+    """
+    Child process: serves a store of books plus the "1984" books searched by
+    measure_latency on a free local port, sent back through ports.
+    """
+    raise_file_limit()
+    store = ConcurrentBookStore()
+    store.add_books(make_books(books))
+    store.add_books(Book("1984", "George Orwell", 9.99, 1) for _ in range(3))
+
+    async def serve():
+        server = await BookServer(AsyncBookStore(store)).start(port=0)
+        ports.put(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def main(clients=CLIENTS):
+    """Prints the p50 and p99 search latencies with clients connections."""
+    raise_file_limit()
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(target=run_server, args=(BOOKS, ports))
+    server.start()
+    try:
+        port = ports.get(timeout=60)
+        start = time.perf_counter()
+        latencies = asyncio.run(
+            measure_latency("127.0.0.1", port, clients, REQUESTS_PER_CLIENT)
+        )
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.join()
+    requests = clients * REQUESTS_PER_CLIENT
+    print(
+        f"{clients} clients, {requests} searches in {elapsed:.1f}s:"
+        f" p50 {latencies['p50'] * 1e3:.2f} ms,"
+        f" p99 {latencies['p99'] * 1e3:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else CLIENTS)
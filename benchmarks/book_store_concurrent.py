@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""
+Search throughput of ConcurrentBookStore from several reader threads, alone
+and while a writer thread keeps adding books.
+"""
+import random
+import sys
+import threading
+import time
+
+from benchmarks.book_store_lookup import make_books
+from white_box.book_store import Book
+from white_box.book_store_concurrent import ConcurrentBookStore
+
+SIZE = 100_000
+READERS = 4
+DURATION = 2.0
+
+
+def run(book_store, readers, writer, duration):
+    """Returns the searches and additions per second over duration."""
+    stop = threading.Event()
+    searches = [0] * readers
+    additions = [0]
+
+    def read(number):
+        rng = random.Random(number)
+        size = len(book_store.books)
+        while not stop.is_set():
+            book_store.find_by_title(f"title {rng.randrange(size)}")
+            searches[number] += 1
+
+    def write():
+        while not stop.is_set():
+            book_store.add_books(
+                Book(f"New title {additions[0] + i}", "Writer", 1.0, 1)
+                for i in range(10)
+            )
+            additions[0] += 10
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    if writer:
+        threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(searches) / duration, additions[0] / duration
+
+
+def main(size=SIZE, readers=READERS, duration=DURATION):
+    """Prints the search rate with and without a concurrent writer."""
+    book_store = ConcurrentBookStore()
+    book_store.add_books(make_books(size))
+    book_store.find_by_title("")
+    for writer in (False, True):
+        searches, additions = run(book_store, readers, writer, duration)
+        label = "with writer" if writer else "readers only"
+        print(f"{label:>12}: {searches:>9.0f} searches/s, {additions:>7.0f} adds/s")
+
+
+if __name__ == "__main__":
+    main(*[int(argument) for argument in sys.argv[1:3]])
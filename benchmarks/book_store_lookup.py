@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""
+Latency of the indexed BookStore title and author lookups from 1k to 1M
+books, next to the linear scan search_book used to do. Every author has
+about ten books, so lookups return the same number of books at every size.
+"""
+import random
+import sys
+import time
+
+from white_box.book_store import Book, BookStore
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+SCAN_LIMIT = 100_000
+QUERIES = 10_000
+
+
+def make_books(count, seed=0):
+    """Returns count books with numbered titles and count / 10 authors."""
+    rng = random.Random(seed)
+    return [
+        Book(f"Title {number}", f"Author {rng.randrange(count // 10)}", 9.99, 1)
+        for number in range(count)
+    ]
+
+
+def scan(books, title):
+    """The former search_book loop, without printing."""
+    return [book for book in books if book.title.lower() == title.lower()]
+
+
+def per_call(function, arguments):
+    """Returns the mean seconds per call of function over arguments."""
+    start = time.perf_counter()
+    for argument in arguments:
+        function(*argument)
+    return (time.perf_counter() - start) / len(arguments)
+
+
+def main(sizes=SIZES):
+    """Prints the lookup latencies for each catalog size."""
+    print(f"{'books':>10} {'title':>10} {'author':>10} {'scan':>10}")
+    for size in sizes:
+        rng = random.Random(size)
+        book_store = BookStore()
+        book_store.add_books(make_books(size))
+        book_store.find_by_title("")
+        titles = [(f"TITLE {rng.randrange(size)}",) for _ in range(QUERIES)]
+        authors = [(f"author {rng.randrange(size // 10)}",) for _ in range(QUERIES)]
+        title = per_call(book_store.find_by_title, titles)
+        author = per_call(book_store.find_by_author, authors)
+        if size <= SCAN_LIMIT:
+            scanned = per_call(
+                scan, [(book_store.books, title) for (title,) in titles[:10]]
+            )
+            scanned = f"{scanned * 1e6:>8.0f}us"
+        else:
+            scanned = f"{'-':>10}"
+        print(f"{size:>10} {title * 1e6:>8.2f}us {author * 1e6:>8.2f}us {scanned}")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or SIZES)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+Memory used by 1M books stored as a list of plain objects (the former Book),
+a list of __slots__ Book records, and BookColumns, measured with tracemalloc.
+"""
+import sys
+import tracemalloc
+
+from white_box.book_store import Book, BookColumns
+
+SIZE = 1_000_000
+
+
+class DictBook:  # pylint: disable=too-few-public-methods
+    """The former Book class, with a per-instance __dict__."""
+
+    def __init__(self, title, author, price, quantity):
+        """Dict book init."""
+        self.title = title
+        self.author = author
+        self.price = price
+        self.quantity = quantity
+
+
+def fill(storage, book_class, size):
+    """Appends size books with distinct titles and 1k authors to storage."""
+    for number in range(size):
+        storage.append(
+            book_class(f"Title {number}", f"Author {number % 1000}", 9.99, number % 50)
+        )
+    return storage
+
+
+def measure(build):
+    """Returns the bytes still allocated by the storage build() returns."""
+    tracemalloc.start()
+    storage = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del storage
+    return size
+
+
+def main(size=SIZE):
+    """Prints the memory used by each storage layout."""
+    layouts = {
+        "list of dict objects": lambda: fill([], DictBook, size),
+        "list of slots Books": lambda: fill([], Book, size),
+        "BookColumns": lambda: fill(BookColumns(), Book, size),
+    }
+    for name, build in layouts.items():
+        used = measure(build)
+        print(f"{name:>22}: {used / 2**20:8.1f} MiB, {used / size:6.1f} B/book")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
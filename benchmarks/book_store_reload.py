@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""
+Reload time of a catalog from a binary snapshot, split into mapping the
+file and building the title and author hash indexes, and the title lookup
+latency right after the reload.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from white_box.book_store import Book, BookColumns, BookStore, dump_snapshot
+
+SIZE = 1_000_000
+
+
+def generate_books(count, seed=0):
+    """Yields count books with numbered titles and 10k authors."""
+    rng = random.Random(seed)
+    for number in range(count):
+        yield Book(
+            f"Title {number}",
+            f"Author {rng.randrange(10_000)}",
+            rng.uniform(1, 100),
+            rng.randint(0, 50),
+        )
+
+
+def main(size=SIZE):
+    """Prints the snapshot reload and lookup timings."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "books.snap")
+        start = time.perf_counter()
+        dump_snapshot(generate_books(size), path)
+        print(f"dump {size} books: {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        columns = BookColumns.from_snapshot(path)
+        mapped = time.perf_counter()
+        book_store = BookStore(columns)
+        indexed = time.perf_counter()
+        print(
+            f"reload: {indexed - start:.2f}s (map {(mapped - start) * 1e3:.2f}ms,"
+            f" index {indexed - mapped:.2f}s)"
+        )
+
+        start = time.perf_counter()
+        book_store.find_by_title(f"title {size // 2}")
+        print(f"first lookup: {(time.perf_counter() - start) * 1e6:.2f}us")
+
+        titles = [f"title {random.randrange(size)}" for _ in range(10_000)]
+        start = time.perf_counter()
+        for title in titles:
+            book_store.find_by_title(title)
+        lookup = (time.perf_counter() - start) / len(titles)
+        print(f"next lookups: {lookup * 1e6:.2f}us")
+        del book_store
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""
+Latency of the BookStore prefix, full-text and fuzzy searches from 1k to 1M
+books.
+"""
+import random
+import string
+import sys
+import time
+
+from white_box.book_store import Book, BookStore
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+QUERIES = 1_000
+
+
+def random_word(rng, length):
+    """Returns a random lower case word."""
+    return "".join(rng.choices(string.ascii_lowercase, k=length))
+
+
+def make_books(count, seed=0):
+    """Returns count books with random two-word titles and 10k authors."""
+    rng = random.Random(seed)
+    authors = [f"{random_word(rng, 6)} {random_word(rng, 8)}" for _ in range(10_000)]
+    return [
+        Book(
+            f"{random_word(rng, 5)} {random_word(rng, 7)}",
+            rng.choice(authors),
+            rng.uniform(1, 100),
+            rng.randint(0, 50),
+        )
+        for _ in range(count)
+    ]
+
+
+def typo(rng, text):
+    """Returns text with one character replaced."""
+    position = rng.randrange(len(text))
+    return text[:position] + rng.choice(string.ascii_lowercase) + text[position + 1 :]
+
+
+def per_call(function, arguments):
+    """Returns the mean seconds per call of function over arguments."""
+    start = time.perf_counter()
+    for argument in arguments:
+        function(*argument)
+    return (time.perf_counter() - start) / len(arguments)
+
+
+def main(sizes=SIZES):
+    """Prints the add throughput and the latency of each search mode."""
+    print(
+        f"{'books':>10} {'add/s':>10} {'fuzzy build':>12}"
+        f" {'prefix':>10} {'text':>10} {'fuzzy':>10}"
+    )
+    for size in sizes:
+        rng = random.Random(size)
+        books = make_books(size)
+        book_store = BookStore()
+        start = time.perf_counter()
+        book_store.add_books(books)
+        add_rate = size / (time.perf_counter() - start)
+        start = time.perf_counter()
+        book_store.search_fuzzy("")
+        fuzzy_build = time.perf_counter() - start
+        samples = rng.choices(books, k=QUERIES)
+        prefix = per_call(
+            book_store.search_prefix, [(book.title[:4], 10) for book in samples]
+        )
+        text = per_call(
+            book_store.search_text,
+            [
+                (f"{book.title.split()[1]} {book.author.split()[0]}",)
+                for book in samples
+            ],
+        )
+        fuzzy = per_call(
+            book_store.search_fuzzy, [(typo(rng, book.title), 2) for book in samples]
+        )
+        print(
+            f"{size:>10} {add_rate:>10.0f} {fuzzy_build:>11.2f}s"
+            f" {prefix * 1e6:>8.1f}us {text * 1e6:>8.1f}us {fuzzy * 1e6:>8.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or SIZES)
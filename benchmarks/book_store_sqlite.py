@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bulk insert throughput and title lookup latency of SQLiteBookStore next to
+the in-memory BookStore.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.book_store_lookup import make_books, per_call
+from white_box.book_store import BookStore
+from white_box.book_store_sqlite import SQLiteBookStore
+
+SIZE = 100_000
+QUERIES = 10_000
+
+
+def measure(book_store, books, titles):
+    """
+    Returns the insert rate, including the first lookup that builds the
+    in-memory index, and the mean title lookup seconds.
+    """
+    start = time.perf_counter()
+    book_store.add_books(books)
+    book_store.find_by_title("")
+    rate = len(books) / (time.perf_counter() - start)
+    return rate, per_call(book_store.find_by_title, titles)
+
+
+def main(size=SIZE):
+    """Prints the insert rate and lookup latency of both stores."""
+    books = make_books(size)
+    rng = random.Random(size)
+    titles = [(f"title {rng.randrange(size)}",) for _ in range(QUERIES)]
+    results = {"in-memory BookStore": measure(BookStore(), books, titles)}
+    with tempfile.TemporaryDirectory() as directory:
+        with SQLiteBookStore(os.path.join(directory, "books.db")) as book_store:
+            results["SQLiteBookStore"] = measure(book_store, books, titles)
+    print(f"{size} books")
+    for name, (rate, lookup) in results.items():
+        print(f"{name:>20}: {rate:>9.0f} books/s, lookup {lookup * 1e6:7.2f}us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
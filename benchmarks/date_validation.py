@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""
+Date validation throughput of validate_date and validate_dates, next to
+the former range check that accepted every day up to 31.
+"""
+import random
+import sys
+import time
+
+from white_box.class_exercises import validate_date
+from white_box.validators import is_valid_date, validate_dates
+
+DATES = 500_000
+REPEATS = 15
+
+
+def range_check(year, month, day):
+    """The former validate_date, which ignored month lengths."""
+    if 1900 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31:
+        return "Valid Date"
+
+    return "Invalid Date"
+
+
+def make_dates(count, seed=0):
+    """Returns count dates, a few of them out of range."""
+    rng = random.Random(seed)
+    return [
+        (rng.randint(1890, 2110), rng.randint(0, 13), rng.randint(0, 32))
+        for _ in range(count)
+    ]
+
+
+def validate_each(function):
+    """Returns a runner calling function on every date of a list."""
+
+    def run(dates):
+        for year, month, day in dates:
+            function(year, month, day)
+
+    return run
+
+
+def main(count=DATES):
+    """
+    Prints the best time of each validator over count dates. The runs of
+    the validators are interleaved so they see the same machine load.
+    """
+    dates = make_dates(count)
+    columns = list(zip(*dates))
+    runners = {
+        "range check": validate_each(range_check),
+        "validate_date": validate_each(validate_date),
+        "is_valid_date": validate_each(is_valid_date),
+        "validate_dates": lambda _: validate_dates(*columns),
+    }
+    best = dict.fromkeys(runners, float("inf"))
+    for _ in range(REPEATS):
+        for name, run in runners.items():
+            start = time.perf_counter()
+            run(dates)
+            best[name] = min(best[name], time.perf_counter() - start)
+    for name, elapsed in best.items():
+        print(f"{name:>14}: {elapsed:8.3f}s for {count} dates")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DATES)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""
+Order pricing throughput of price_orders_parallel from 1 worker up to the
+number of cores, next to the scalar calculate_order_total loop.
+"""
+import os
+import random
+import sys
+import time
+
+from white_box.class_exercises import calculate_order_total, calculate_total_discount
+from white_box.order_pricing import orders_to_columns, price_orders_parallel
+
+ORDERS = 1_000_000
+CHUNK_SIZE = 50_000
+
+
+def make_orders(count, seed=0):
+    """Returns count random orders of 1 to 8 lines."""
+    rng = random.Random(seed)
+    return [
+        [
+            {"quantity": rng.randint(1, 15), "price": round(rng.uniform(0.01, 500), 2)}
+            for _ in range(rng.randint(1, 8))
+        ]
+        for _ in range(count)
+    ]
+
+
+def main(count=ORDERS, max_workers=None):
+    """Prints the orders per second of the scalar loop and of each pool size."""
+    orders = make_orders(count)
+    start = time.perf_counter()
+    expected = sum(
+        calculate_total_discount(calculate_order_total(items)) for items in orders
+    )
+    elapsed = time.perf_counter() - start
+    print(f"{'scalar':>10}: {elapsed:8.3f}s, {count / elapsed:12.0f} orders/s")
+
+    columns = orders_to_columns(orders)
+    for workers in range(1, (max_workers or os.cpu_count() or 1) + 1):
+        start = time.perf_counter()
+        result = price_orders_parallel(*columns, workers=workers, chunk_size=CHUNK_SIZE)
+        elapsed = time.perf_counter() - start
+        assert abs(result.discount - expected) <= 1e-6 * max(1, abs(expected))
+        print(
+            f"{workers:>2} workers: {elapsed:8.3f}s, {count / elapsed:12.0f} orders/s"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else ORDERS,
+        int(sys.argv[2]) if len(sys.argv) > 2 else None,
+    )
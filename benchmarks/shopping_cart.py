@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""
+ShoppingCart add, update and remove throughput for carts of 10k distinct
+products, next to the former list-scanning cart, and the cost of reading
+the exact subtotal after every change next to summing the lines again.
+"""
+import sys
+import time
+
+from white_box.class_exercises import Product, ShoppingCart
+
+PRODUCTS = 10_000
+
+
+class ListCart:
+    """The former ShoppingCart, which scanned its list of lines."""
+
+    def __init__(self):
+        """List cart init."""
+        self.items = []
+
+    def add_product(self, product, quantity=1):
+        """Adds a product, scanning the lines for it."""
+        for item in self.items:
+            if item["product"] == product:
+                item["quantity"] += quantity
+                break
+        else:
+            self.items.append({"product": product, "quantity": quantity})
+
+    def remove_product(self, product, quantity=1):
+        """Removes a product, scanning the lines for it."""
+        for item in self.items:
+            if item["product"] == product:
+                if item["quantity"] <= quantity:
+                    self.items.remove(item)
+                else:
+                    item["quantity"] -= quantity
+                break
+
+
+def exercise(cart, products):
+    """Returns the seconds taken to add, update and remove every product."""
+    start = time.perf_counter()
+    for product in products:
+        cart.add_product(product, 2)
+    for product in products:
+        cart.add_product(product)
+    for product in products:
+        cart.remove_product(product, 3)
+    return time.perf_counter() - start
+
+
+def exercise_totals(cart, products, recompute):
+    """
+    Returns the seconds taken to add then remove every product, reading the
+    cart total after each change, either from the kept subtotal or by
+    summing the lines again.
+    """
+    start = time.perf_counter()
+    changes = [cart.add_product] * len(products) + [cart.remove_product] * len(products)
+    for change, product in zip(changes, products + products):
+        change(product)
+        if recompute:
+            sum(item["product"].price * item["quantity"] for item in cart.items)
+        else:
+            cart.subtotal  # pylint: disable=pointless-statement
+    return time.perf_counter() - start
+
+
+def main(count=PRODUCTS):
+    """Prints the time per cart operation of both carts."""
+    products = [Product(f"Product {number}", 1.5) for number in range(count)]
+    operations = 3 * count
+    for name, cart in (("ShoppingCart", ShoppingCart()), ("list cart", ListCart())):
+        elapsed = exercise(cart, products)
+        print(
+            f"{name:>12}: {elapsed:8.3f}s for {operations} operations,"
+            f" {elapsed / operations * 1e6:9.2f}us each"
+        )
+    products = [Product(f"Product {n}", 0.1 * (n % 7 + 1)) for n in range(count)]
+    operations = 2 * count
+    for name, recompute in (("kept total", False), ("recomputed", True)):
+        elapsed = exercise_totals(ShoppingCart(), products, recompute)
+        print(
+            f"{name:>12}: {elapsed:8.3f}s for {operations} changes and totals,"
+            f" {elapsed / operations * 1e6:9.2f}us each"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else PRODUCTS)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+URL validation throughput of validate_urls and parse_url, next to a check
+built on urllib.parse.urlsplit.
+"""
+import random
+import sys
+import time
+from urllib.parse import urlsplit
+
+from white_box.validators import URL_MAX_LENGTH, parse_url, validate_urls
+
+URLS = 1_000_000
+REPEATS = 5
+
+
+def urlsplit_check(url):
+    """
+    Returns whether urlsplit finds an http or https URL with a host and a
+    valid port, within URL_MAX_LENGTH characters. It does not check the
+    host syntax, so it accepts hosts such as a..b that parse_url rejects.
+    """
+    if len(url) > URL_MAX_LENGTH:
+        return False
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return False
+    return parts.scheme in ("http", "https") and bool(parts.hostname) and port != 0
+
+
+def make_urls(count, seed=0):
+    """Returns count crawl frontier URLs, about one in five invalid."""
+    rng = random.Random(seed)
+    hosts = [f"www.site{number}.example.com" for number in range(1000)]
+    hosts += ["192.168.0.1", "[2001:db8::1]", "localhost"]
+    invalid = ["ftp://example.com/file", "http://", "https://a..b/", "notaurl"]
+    urls = []
+    for _ in range(count):
+        if rng.random() < 0.2:
+            urls.append(rng.choice(invalid))
+            continue
+        scheme = rng.choice(("http", "https"))
+        port = rng.choice(("", ":8080", ":443"))
+        path = "/" + "/".join(f"page{rng.randrange(100)}" for _ in range(3))
+        urls.append(f"{scheme}://{rng.choice(hosts)}{port}{path}?q={rng.random()}")
+    return urls
+
+
+def main(count=URLS):
+    """Prints the URLs per second of each validator."""
+    urls = make_urls(count)
+    runners = {
+        "validate_urls": lambda: validate_urls(urls),
+        "parse_url": lambda: [parse_url(url) for url in urls],
+        "urlsplit": lambda: bytearray(map(urlsplit_check, urls)),
+    }
+    for name, run in runners.items():
+        elapsed = float("inf")
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            run()
+            elapsed = min(elapsed, time.perf_counter() - start)
+        print(f"{name:>14}: {elapsed:8.3f}s, {count / elapsed:12.0f} URLs/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else URLS)
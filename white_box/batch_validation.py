@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+"""
+Batch validation of records with the input validation functions.
+Each record is validated in a single pass and its results are packed into
+one byte: bit i is set when check i of CHECKS passed.
+"""
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from white_box.class_exercises import (
+    validate_credit_card,
+    validate_date,
+    validate_email,
+    validate_login,
+    validate_password,
+    validate_url,
+)
+
+
+def _check_password(record):
+    """Runs validate_password on a record."""
+    return validate_password(record["password"])
+
+
+def _check_email(record):
+    """Runs validate_email on a record."""
+    return validate_email(record["email"]) == "Valid Email"
+
+
+def _check_credit_card(record):
+    """Runs validate_credit_card on a record."""
+    return validate_credit_card(record["card_number"]) == "Valid Card"
+
+
+def _check_url(record):
+    """Runs validate_url on a record."""
+    return validate_url(record["url"]) == "Valid URL"
+
+
+def _check_login(record):
+    """Runs validate_login on a record."""
+    return validate_login(record["username"], record["password"]) == "Login Successful"
+
+
+def _check_date(record):
+    """Runs validate_date on a record."""
+    return validate_date(record["year"], record["month"], record["day"]) == "Valid Date"
+
+
+# (name, record fields, check) in bit order.
+CHECKS = (
+    ("password", ("password",), _check_password),
+    ("email", ("email",), _check_email),
+    ("credit_card", ("card_number",), _check_credit_card),
+    ("url", ("url",), _check_url),
+    ("login", ("username", "password"), _check_login),
+    ("date", ("year", "month", "day"), _check_date),
+)
+CHECK_BITS = {name: 1 << bit for bit, (name, _, _) in enumerate(CHECKS)}
+
+
+def _selected_checks(names):
+    """Returns the (bit, check) pairs of the named checks."""
+    unknown = set(names) - set(CHECK_BITS)
+    if unknown:
+        raise ValueError(f"Invalid checks {sorted(unknown)}")
+    return [(CHECK_BITS[name], check) for name, _, check in CHECKS if name in names]
+
+
+def _validate_chunk(records, names):
+    """Returns the result bytes of a list of records."""
+    checks = _selected_checks(names)
+    results = array("B")
+    for record in records:
+        mask = 0
+        for bit, check in checks:
+            if check(record):
+                mask |= bit
+        results.append(mask)
+    return results
+
+
+def _chunks(records, chunk_size):
+    """Yields lists of chunk_size records."""
+    records = iter(records)
+    while chunk := list(islice(records, chunk_size)):
+        yield chunk
+
+
+def validate_records(records, checks, workers=None, chunk_size=10000):
+    """
+    Validates an iterable of record dicts with the named checks and returns
+    an array of result bytes, one per record. With workers, chunks of
+    chunk_size records are validated on a process pool, at most two per
+    worker at a time, so records are read from the iterable only as fast as
+    they are validated.
+    """
+    checks = tuple(checks)
+    if not workers:
+        return _validate_chunk(records, checks)
+    results = array("B")
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in _chunks(records, chunk_size):
+            if len(pending) >= 2 * workers:
+                results.extend(pending.popleft().result())
+            pending.append(executor.submit(_validate_chunk, chunk, checks))
+        while pending:
+            results.extend(pending.popleft().result())
+    return results
+
+
+def validate_columns(columns, workers=None, chunk_size=10000):
+    """
+    Validates columns of values given as a dict of field name to sequence,
+    e.g. {"email": [...], "password": [...]}. Every check whose fields are
+    all present is run. Returns the result bytes and the check names.
+    """
+    checks = [
+        name for name, fields, _ in CHECKS if all(field in columns for field in fields)
+    ]
+    fields = list(columns)
+    records = (dict(zip(fields, values)) for values in zip(*columns.values()))
+    return validate_records(records, checks, workers, chunk_size), checks
+
+
+def passed(result, check):
+    """Returns whether the named check passed in a result byte."""
+    return bool(result & CHECK_BITS[check])
+
+
+def failed_checks(result, checks):
+    """Returns the names of the checks, among checks, that did not pass."""
+    return [check for check in checks if not result & CHECK_BITS[check]]
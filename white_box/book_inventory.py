@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+"""
+Book inventory example: stock movements over a book store.
+"""
+import threading
+from collections import Counter
+
+
+def _check_quantity(quantity):
+    """Raises ValueError unless quantity is a positive whole number of units."""
+    if not isinstance(quantity, int):
+        raise ValueError("Quantity must be a whole number of units")
+    if quantity <= 0:
+        raise ValueError("Quantity must be positive")
+
+
+class BookInventory:
+    """
+    Stock movements for the books of a store, identified by their row in
+    store.books. Books with at most low_stock_limit units are kept in
+    quantity buckets, so low-stock queries never scan the catalog. Stock
+    and units sold are also totalled per title.
+    """
+
+    def __init__(self, store, low_stock_limit=10):
+        """Indexes the current stock of the store."""
+        self.store = store
+        self.low_stock_limit = low_stock_limit
+        self._lock = threading.Lock()
+        self._reserved = Counter()
+        self._buckets = {}
+        self._stock_by_title = Counter()
+        self._sold_by_title = Counter()
+        self._tracked = 0
+        self._track_new_books()
+
+    def _track_new_books(self):
+        """Indexes the books added to the store since the last call."""
+        books = self.store.books
+        for row in range(self._tracked, len(books)):
+            book = books[row]
+            self._bucket_add(row, book.quantity)
+            self._stock_by_title[book.title.casefold()] += book.quantity
+        self._tracked = len(books)
+
+    def _bucket_add(self, row, quantity):
+        """Adds a row to the bucket of its quantity, if it is low."""
+        if quantity <= self.low_stock_limit:
+            self._buckets.setdefault(quantity, set()).add(row)
+
+    def _bucket_remove(self, row, quantity):
+        """Removes a row from the bucket of its quantity, if it is low."""
+        if quantity <= self.low_stock_limit:
+            bucket = self._buckets[quantity]
+            bucket.discard(row)
+            if not bucket:
+                del self._buckets[quantity]
+
+    def _set_quantity(self, row, quantity):
+        """
+        Stores a new quantity, then updates the indexes, so a failed write
+        leaves them unchanged.
+        """
+        book = self.store.books[row]
+        previous = book.quantity
+        set_quantity = getattr(self.store, "set_quantity", None)
+        if set_quantity is None:
+            book.quantity = quantity
+        else:
+            # Persistent stores log the change.
+            set_quantity(row, quantity)
+        self._bucket_remove(row, previous)
+        self._bucket_add(row, quantity)
+        self._stock_by_title[book.title.casefold()] += quantity - previous
+
+    def available(self, row):
+        """Returns the units of a book that are neither sold nor reserved."""
+        return self.store.books[row].quantity - self._reserved[row]
+
+    def sell(self, row, quantity=1, reserved=False):
+        """
+        Sells units of a book, taking them from its reservation when reserved
+        is True. Raises ValueError if there is not enough stock.
+        """
+        _check_quantity(quantity)
+        with self._lock:
+            self._track_new_books()
+            if reserved:
+                if self._reserved[row] < quantity:
+                    raise ValueError("Not enough reserved units")
+                self._reserved[row] -= quantity
+            elif self.available(row) < quantity:
+                raise ValueError("Insufficient stock")
+            book = self.store.books[row]
+            self._set_quantity(row, book.quantity - quantity)
+            self._sold_by_title[book.title.casefold()] += quantity
+
+    def restock(self, row, quantity):
+        """Adds units of a book to the stock."""
+        _check_quantity(quantity)
+        with self._lock:
+            self._track_new_books()
+            self._set_quantity(row, self.store.books[row].quantity + quantity)
+
+    def reserve(self, row, quantity=1):
+        """
+        Holds units of a book for a later sale. Raises ValueError if there is
+        not enough stock.
+        """
+        _check_quantity(quantity)
+        with self._lock:
+            self._track_new_books()
+            if self.available(row) < quantity:
+                raise ValueError("Insufficient stock")
+            self._reserved[row] += quantity
+
+    def release(self, row, quantity=1):
+        """Returns reserved units of a book to the available stock."""
+        _check_quantity(quantity)
+        with self._lock:
+            self._reserved[row] -= min(quantity, self._reserved[row])
+
+    def apply_movements(self, movements):
+        """
+        Applies (row, delta) stock movements as one batch: either every
+        movement is applied or, if any book would end below its reserved
+        units, none is and ValueError is raised. Negative deltas count as
+        units sold, like sell.
+        """
+        deltas = Counter()
+        sold = Counter()
+        for row, delta in movements:
+            if not isinstance(delta, int):
+                raise ValueError("Movements must be whole numbers of units")
+            deltas[row] += delta
+            if delta < 0:
+                sold[row] -= delta
+        with self._lock:
+            self._track_new_books()
+            for row, delta in deltas.items():
+                if self.available(row) + delta < 0:
+                    raise ValueError(f"Insufficient stock for row {row}")
+            for row, delta in deltas.items():
+                if delta:
+                    self._set_quantity(row, self.store.books[row].quantity + delta)
+            for row, units in sold.items():
+                self._sold_by_title[self.store.books[row].title.casefold()] += units
+
+    def low_stock(self, threshold=None):
+        """
+        Returns the rows of the books with at most threshold units, lowest
+        stock first. threshold defaults to, and may not exceed,
+        low_stock_limit.
+        """
+        if threshold is None:
+            threshold = self.low_stock_limit
+        if threshold > self.low_stock_limit:
+            raise ValueError("threshold is above the low stock limit")
+        with self._lock:
+            self._track_new_books()
+            return [
+                row
+                for quantity in sorted(self._buckets)
+                if quantity <= threshold
+                for row in sorted(self._buckets[quantity])
+            ]
+
+    def title_stock(self, title):
+        """Returns the units in stock of every book with this title."""
+        with self._lock:
+            self._track_new_books()
+            return self._stock_by_title[title.casefold()]
+
+    def title_sold(self, title):
+        """Returns the units sold of every book with this title."""
+        return self._sold_by_title[title.casefold()]
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+"""
+Persistent book store example: a write-ahead log on top of binary snapshots.
+"""
+import json
+import os
+import struct
+
+from white_box.book_store import Book, BookColumns, BookStore, dump_snapshot
+
+SNAPSHOT_NAME = "books.snap"
+LOG_NAME = "books.wal"
+# Appended to snapshots: the generation of the log that follows them.
+GENERATION_TRAILER = struct.Struct("<8sQ")
+GENERATION_MAGIC = b"BOOKGEN1"
+
+
+def _scan_log(path):
+    """
+    Yields the records of a write-ahead log with the offset where each one
+    ends. Every record ends with a newline, so a last line without one was
+    torn by a crash and ends the log.
+    """
+    with open(path, "rb") as file:
+        offset = 0
+        for line in file:
+            if not line.endswith(b"\n"):
+                return
+            offset += len(line)
+            yield json.loads(line), offset
+
+
+def read_log(path):
+    """
+    Yields the change records of a write-ahead log, ignoring a torn last
+    record.
+    """
+    for record, _ in _scan_log(path):
+        if record["op"] != "generation":
+            yield record
+
+
+def log_generation(path):
+    """Returns the generation of a log: 0 unless its first record sets one."""
+    for record, _ in _scan_log(path):
+        return record["generation"] if record["op"] == "generation" else 0
+    return 0
+
+
+def snapshot_generation(path):
+    """Returns the generation written after a snapshot, 0 if there is none."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < GENERATION_TRAILER.size:
+            return 0
+        file.seek(-GENERATION_TRAILER.size, os.SEEK_END)
+        magic, generation = GENERATION_TRAILER.unpack(file.read())
+    return generation if magic == GENERATION_MAGIC else 0
+
+
+def _fsync_directory(directory):
+    """Makes the renames done in directory durable."""
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+class PersistentBookStore(BookStore):
+    """
+    Book store that survives restarts. Every change is appended to a
+    write-ahead log, which is fsynced once per sync_every records (group
+    commit). compact() folds the log into a new snapshot; it also runs
+    after any change that brings the log to compact_every records.
+
+    Snapshots and logs carry a generation. compact() writes a snapshot of
+    generation g + 1 before it replaces the log of generation g, so after a
+    crash in between, recovery sees that the old log is already in the
+    snapshot and does not replay it.
+    """
+
+    def __init__(self, directory, sync_every=1000, compact_every=None):
+        """
+        Recovers the store from the latest snapshot and the log in directory.
+        """
+        self.directory = directory
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_NAME)
+        self.log_path = os.path.join(directory, LOG_NAME)
+        self.sync_every = sync_every
+        self.compact_every = compact_every
+        self.generation = 0
+        self._pending = 0
+        self._log_records = 0
+        os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.snapshot_path):
+            super().__init__(BookColumns.from_snapshot(self.snapshot_path))
+            self.generation = snapshot_generation(self.snapshot_path)
+        else:
+            super().__init__(BookColumns())
+        if not os.path.exists(self.log_path):
+            self._start_log()
+            return
+        generation = log_generation(self.log_path)
+        if generation > self.generation:
+            raise ValueError(f"Log '{self.log_path}' is newer than the snapshot")
+        if generation < self.generation:
+            # A compaction stopped after the snapshot was replaced.
+            self._start_log()
+            return
+        end = self._replay(_scan_log(self.log_path))
+        if end < os.path.getsize(self.log_path):
+            # Cut the torn last record, so new records start on a new line.
+            os.truncate(self.log_path, end)
+        self._log = open(  # pylint: disable=consider-using-with
+            self.log_path, "a", encoding="utf-8"
+        )
+
+    def _replay(self, records):
+        """
+        Applies log records without logging them again. Returns the offset
+        where the last complete record ends.
+        """
+        end = 0
+
+        def replayed_books():
+            nonlocal end
+            for record, end in records:
+                if record["op"] == "generation":
+                    continue
+                self._log_records += 1
+                if record["op"] == "add":
+                    yield Book(
+                        record["title"],
+                        record["author"],
+                        record["price"],
+                        record["quantity"],
+                    )
+                elif record["op"] == "quantity":
+                    self.books[record["row"]].quantity = record["quantity"]
+                else:
+                    raise ValueError(f"Invalid log record '{record}'")
+
+        BookStore.add_books(self, replayed_books())
+        return end
+
+    def _start_log(self):
+        """Atomically replaces the log with an empty one of this generation."""
+        temporary_path = self.log_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write(json.dumps({"op": "generation", "generation": self.generation}))
+            file.write("\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.log_path)
+        _fsync_directory(self.directory)
+        self._log_records = 0
+        self._log = open(  # pylint: disable=consider-using-with
+            self.log_path, "a", encoding="utf-8"
+        )
+
+    def _append(self, record):
+        """Appends a record to the log, syncing once per batch."""
+        self._log.write(json.dumps(record) + "\n")
+        self._pending += 1
+        self._log_records += 1
+        if self._pending >= self.sync_every:
+            self.sync()
+
+    def _compact_if_due(self):
+        """
+        Compacts once the log holds compact_every records. Called after a
+        change is applied, as add_books logs books before storing them.
+        """
+        if self.compact_every and self._log_records >= self.compact_every:
+            self.compact()
+
+    def _append_book(self, book):
+        """Appends an add record for a book."""
+        self._append(
+            {
+                "op": "add",
+                "title": book.title,
+                "author": book.author,
+                "price": book.price,
+                "quantity": book.quantity,
+            }
+        )
+
+    def add_book(self, book):
+        """Adds a book to the store and logs it."""
+        super().add_book(book)
+        self._append_book(book)
+        self._compact_if_due()
+
+    def add_books(self, books):
+        """Adds many books without printing and logs them."""
+
+        def logged(books):
+            for book in books:
+                self._append_book(book)
+                yield book
+
+        count = super().add_books(logged(books))
+        self._compact_if_due()
+        return count
+
+    def set_quantity(self, row, quantity):
+        """Sets the quantity of the book stored at row and logs the change."""
+        self.books[row].quantity = quantity
+        self._append({"op": "quantity", "row": row, "quantity": quantity})
+        self._compact_if_due()
+
+    def sync(self):
+        """Flushes the log and makes it durable."""
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._pending = 0
+
+    def compact(self):
+        """Writes a new snapshot and starts an empty log."""
+        self.sync()
+        temporary_path = self.snapshot_path + ".tmp"
+        dump_snapshot(self.books, temporary_path)
+        with open(temporary_path, "ab") as file:
+            file.write(GENERATION_TRAILER.pack(GENERATION_MAGIC, self.generation + 1))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+        _fsync_directory(self.directory)
+        self.generation += 1
+        self._log.close()
+        self._start_log()
+
+    def close(self):
+        """Syncs and closes the log."""
+        self.sync()
+        self._log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+asyncio front-end for the book store: coroutines and a JSON line server.
+"""
+import asyncio
+import json
+import time
+
+from white_box.book_store import BOOK_FIELDS, Book
+from white_box.book_store_concurrent import ConcurrentBookStore
+
+# Most books a "list" request returns, whatever limit it asks for.
+LIST_LIMIT_MAX = 1000
+
+
+def _book_dict(book):
+    """Returns the fields of a book as a dict."""
+    return {field: getattr(book, field) for field in BOOK_FIELDS}
+
+
+class AsyncBookStore:
+    """
+    Coroutine API over a shared book store. Every store call may wait for
+    the store lock or for persistence, so it runs in an executor and never
+    blocks the event loop.
+    """
+
+    def __init__(self, store=None, executor=None):
+        """Async book store init."""
+        self.store = ConcurrentBookStore() if store is None else store
+        self.executor = executor
+
+    async def _run(self, function, *args):
+        """Runs a store call in the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    async def add_book(self, book):
+        """Adds a book to the store without printing."""
+        await self._run(self.store.add_books, [book])
+
+    async def search_book(self, title):
+        """Returns the books matching a title, ignoring case."""
+        return await self._run(self.store.find_by_title, title)
+
+    async def list_books(self, offset=0, limit=100):
+        """Returns a page of the store books."""
+        return await self._run(self.store.page_books, offset, limit)
+
+
+class BookServer:
+    """
+    Line protocol server. Each request is a JSON object on its own line:
+    {"op": "add", "title": ..., "author": ..., "price": ..., "quantity": ...},
+    {"op": "search", "title": ...} or {"op": "list", "offset": ..., "limit": ...}.
+    List limits are capped at LIST_LIMIT_MAX. Each response is a JSON object on its own line with either "books" or
+    "error".
+    """
+
+    def __init__(self, books=None):
+        """Book server init."""
+        self.books = AsyncBookStore() if books is None else books
+
+    async def handle_request(self, request):
+        """Returns the response to one decoded request."""
+        op = request.get("op")
+        if op == "add":
+            book = Book(
+                request["title"],
+                request["author"],
+                float(request["price"]),
+                int(request["quantity"]),
+            )
+            await self.books.add_book(book)
+            return {"books": [_book_dict(book)]}
+        if op == "search":
+            found_books = await self.books.search_book(request["title"])
+        elif op == "list":
+            found_books = await self.books.list_books(
+                int(request.get("offset", 0)),
+                min(int(request.get("limit", 100)), LIST_LIMIT_MAX),
+            )
+        else:
+            return {"error": f"Invalid operation '{op}'"}
+        return {"books": [_book_dict(book) for book in found_books]}
+
+    async def handle_client(self, reader, writer):
+        """Serves the requests of one connection until it closes."""
+        try:
+            while line := await reader.readline():
+                try:
+                    response = await self.handle_request(json.loads(line))
+                except (ValueError, KeyError, TypeError, AttributeError) as error:
+                    response = {"error": f"Invalid request: {error}"}
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8888):
+        """Starts listening and returns the asyncio server."""
+        return await asyncio.start_server(
+            self.handle_client, host, port, limit=2**20, backlog=4096
+        )
+
+
+def percentile(sorted_values, fraction):
+    """Returns the value at the given fraction of a sorted list."""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def measure_latency(host, port, clients=100, requests_per_client=10):
+    """
+    Load generator: opens clients concurrent connections, sends
+    requests_per_client search requests on each and returns the p50 and p99
+    latencies in seconds.
+    """
+    request = json.dumps({"op": "search", "title": "1984"}).encode("utf-8") + b"\n"
+    latencies = []
+
+    async def run_client():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for _ in range(requests_per_client):
+                started = time.perf_counter()
+                writer.write(request)
+                await writer.drain()
+                await reader.readline()
+                latencies.append(time.perf_counter() - started)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    await asyncio.gather(*(run_client() for _ in range(clients)))
+    latencies.sort()
+    return {"p50": percentile(latencies, 0.5), "p99": percentile(latencies, 0.99)}
+
+
+async def serve(host="127.0.0.1", port=8888):
+    """Runs the book server until cancelled."""
+    server = await BookServer().start(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    """Application entrypoint."""
+    asyncio.run(serve())
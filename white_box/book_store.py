@@ -3,6 +3,70 @@
 """
 Book store example.
 """
+import csv
+import gc
+import io
+import json
+import mmap
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from itertools import islice
+
+BOOK_FIELDS = ("title", "author", "price", "quantity")
+TOKEN_PATTERN = re.compile(r"\w+")
+SNAPSHOT_MAGIC = b"BOOKSNP1"
+SNAPSHOT_HEADER = struct.Struct("<8sQQ")
+STRING_CHUNK = 65536
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Pauses the cyclic garbage collector, which would otherwise rescan the
+    growing indexes again and again while they are built in bulk.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def edit_distance(first, second, limit):
+    """
+    Returns the Levenshtein distance between two strings, or limit + 1 if it
+    exceeds limit. Only the cells within limit of the diagonal are computed.
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    if first == second:
+        return 0
+    over = limit + 1
+    previous = [j if j <= limit else over for j in range(len(second) + 1)]
+    for i, first_char in enumerate(first, 1):
+        current = [over] * (len(second) + 1)
+        if i <= limit:
+            current[0] = i
+        row_min = current[0]
+        for j in range(max(1, i - limit), min(len(second), i + limit) + 1):
+            cost = previous[j - 1] + (first_char != second[j - 1])
+            if previous[j] < cost:
+                cost = previous[j] + 1
+            if current[j - 1] < cost:
+                cost = current[j - 1] + 1
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > limit:
+            return over
+        previous = current
+    return min(previous[-1], over)
 
 
 class Book:  # pylint: disable=too-few-public-methods
@@ -10,6 +74,8 @@ class Book:  # pylint: disable=too-few-public-methods
     Book class.
     """
 
+    __slots__ = ("title", "author", "price", "quantity")
+
     def __init__(self, title, author, price, quantity):
         """Book init."""
         self.title = title
@@ -25,20 +91,533 @@ class Book:  # pylint: disable=too-few-public-methods
         print(f"Quantity: {self.quantity}")
 
 
+class BookView:
+    """
+    Lightweight view over one row of a BookColumns store.
+    """
+
+    __slots__ = ("_columns", "_row")
+
+    def __init__(self, columns, row):
+        """Book view init."""
+        self._columns = columns
+        self._row = row
+
+    @property
+    def title(self):
+        """Book title."""
+        return self._columns.titles[self._row]
+
+    @property
+    def author(self):
+        """Book author."""
+        return self._columns.authors[self._row]
+
+    @property
+    def price(self):
+        """Book price."""
+        return self._columns.prices[self._row]
+
+    @price.setter
+    def price(self, value):
+        self._columns.prices[self._row] = value
+
+    @property
+    def quantity(self):
+        """Book quantity."""
+        return self._columns.quantities[self._row]
+
+    @quantity.setter
+    def quantity(self, value):
+        self._columns.quantities[self._row] = value
+
+    display = Book.display
+
+
+class StringColumn:
+    """
+    Column of strings mapped from a snapshot string table. Strings are
+    decoded when read, and strings appended later are kept in a list.
+    """
+
+    def __init__(self, blob, offsets, first):
+        """
+        String column init. The strings of the column are the entries first,
+        first + 2, ... of the string table, as titles and authors alternate.
+        """
+        self._blob = blob
+        self._offsets = offsets
+        self._first = first
+        self._mapped = (len(offsets) - 1) // 2
+        self._appended = []
+
+    def append(self, text):
+        """Appends a string."""
+        self._appended.append(text)
+
+    def __len__(self):
+        return self._mapped + len(self._appended)
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("string index out of range")
+        if row >= self._mapped:
+            return self._appended[row - self._mapped]
+        entry = 2 * row + self._first
+        return str(self._blob[self._offsets[entry] : self._offsets[entry + 1]], "utf-8")
+
+    def __iter__(self):
+        return self.iter_from(0)
+
+    def iter_from(self, start):
+        """Yields the strings from row start on."""
+        stop = 2 * self._mapped + self._first
+        for first in range(2 * start + self._first, stop, 2 * STRING_CHUNK):
+            # Offsets are read in chunks of plain ints, which index faster
+            # than the memoryview.
+            bounds = self._offsets[first : min(first + 2 * STRING_CHUNK, stop)]
+            bounds = bounds.tolist()
+            for begin, end in zip(bounds[0::2], bounds[1::2]):
+                yield str(self._blob[begin:end], "utf-8")
+        yield from self._appended[max(start - self._mapped, 0) :]
+
+
+class BookColumns:
+    """
+    Columnar book storage: interned titles and authors, and packed arrays of
+    prices and quantities. It behaves like a list of books and hands out
+    BookView objects.
+    """
+
+    def __init__(self):
+        """Book columns init."""
+        self.titles = []
+        self.authors = []
+        self.prices = array("d")
+        self.quantities = array("l")
+
+    def append(self, book):
+        """Stores the fields of a book as a new row."""
+        if not isinstance(self.prices, array):
+            # Columns mapped from a snapshot are copied before they can grow.
+            self.prices = array("d", self.prices)
+            self.quantities = array("l", self.quantities)
+        self.titles.append(sys.intern(book.title))
+        self.authors.append(sys.intern(book.author))
+        self.prices.append(book.price)
+        self.quantities.append(book.quantity)
+
+    def __len__(self):
+        return len(self.titles)
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("book index out of range")
+        return BookView(self, row)
+
+    def __iter__(self):
+        return (BookView(self, row) for row in range(len(self)))
+
+    def fields(self, start=0):
+        """Yields the (title, author) pairs of the rows from start on."""
+        if isinstance(self.titles, StringColumn):
+            return zip(self.titles.iter_from(start), self.authors.iter_from(start))
+        return zip(self.titles[start:], self.authors[start:])
+
+    @classmethod
+    def from_snapshot(cls, path):
+        """
+        Loads a snapshot written by dump_snapshot. Prices and quantities are
+        memoryviews over the mapped file, so they are not copied, and titles
+        and authors are decoded when read, so loading takes constant time.
+        """
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, count, blob_size = SNAPSHOT_HEADER.unpack_from(mapped)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"Invalid snapshot file '{path}'")
+        view = memoryview(mapped)
+        position = SNAPSHOT_HEADER.size
+        columns = cls()
+        columns.prices = view[position : position + 8 * count].cast("d")
+        position += 8 * count
+        columns.quantities = view[position : position + 8 * count].cast("q")
+        position += 8 * count
+        offsets = view[position : position + 8 * (2 * count + 1)].cast("Q")
+        position += 8 * (2 * count + 1)
+        blob = view[position : position + blob_size]
+        columns.titles = StringColumn(blob, offsets, 0)
+        columns.authors = StringColumn(blob, offsets, 1)
+        return columns
+
+
+def dump_snapshot(books, path):
+    """
+    Writes the books to a binary snapshot: a header, fixed-size price and
+    quantity records in native byte order, and a string table for titles
+    and authors.
+    """
+    prices = array("d")
+    quantities = array("q")
+    offsets = array("Q", [0])
+    blob = bytearray()
+    for book in books:
+        prices.append(book.price)
+        quantities.append(book.quantity)
+        for text in (book.title, book.author):
+            blob += text.encode("utf-8")
+            offsets.append(len(blob))
+    with open(path, "wb") as file:
+        file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(prices), len(blob)))
+        file.write(prices.tobytes())
+        file.write(quantities.tobytes())
+        file.write(offsets.tobytes())
+        file.write(blob)
+
+
+def read_books(file, fmt="csv"):
+    """
+    Lazily reads books from a CSV (with header) or JSON Lines text file.
+    """
+    if fmt == "csv":
+        records = csv.DictReader(file)
+    elif fmt == "jsonl":
+        records = (json.loads(line) for line in file if line.strip())
+    else:
+        raise ValueError(f"Invalid format '{fmt}'")
+    for record in records:
+        yield Book(
+            record["title"],
+            record["author"],
+            float(record["price"]),
+            int(record["quantity"]),
+        )
+
+
+def _text_renderer(buffer):
+    """Returns a row writer using the same layout as Book.display."""
+
+    def write_row(book):
+        buffer.write(
+            f"Title: {book.title}\nAuthor: {book.author}\n"
+            f"Price: ${book.price}\nQuantity: {book.quantity}\n"
+        )
+
+    return write_row
+
+
+def _csv_renderer(buffer):
+    """Writes the CSV header and returns a CSV row writer."""
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(BOOK_FIELDS)
+
+    def write_row(book):
+        writer.writerow((book.title, book.author, book.price, book.quantity))
+
+    return write_row
+
+
+def _jsonl_renderer(buffer):
+    """Returns a JSON Lines row writer."""
+
+    def write_row(book):
+        buffer.write(json.dumps({field: getattr(book, field) for field in BOOK_FIELDS}))
+        buffer.write("\n")
+
+    return write_row
+
+
+RENDERERS = {"text": _text_renderer, "csv": _csv_renderer, "jsonl": _jsonl_renderer}
+
+
+def render_books(books, fmt="text", offset=0, limit=None, batch_size=1000):
+    """
+    Yields the books rendered in the given format ("text", "csv" or "jsonl"),
+    batch_size books per chunk, skipping offset books and stopping after limit.
+    """
+    if fmt not in RENDERERS:
+        raise ValueError(f"Invalid format '{fmt}'")
+    stop = None if limit is None else offset + limit
+    buffer = io.StringIO()
+    write_row = RENDERERS[fmt](buffer)
+    for count, book in enumerate(islice(books, offset, stop), 1):
+        write_row(book)
+        if count % batch_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def write_books(books, sink, fmt="text", offset=0, limit=None, batch_size=1000):
+    """Writes the rendered books to a file-like sink, one write per batch."""
+    for chunk in render_books(books, fmt, offset, limit, batch_size):
+        sink.write(chunk)
+
+
+FUZZY_INDEX_DISTANCE = 2
+
+
+class FuzzyIndex:
+    """
+    Title index for edit distance searches up to max_distance. Titles are
+    split into max_distance + 1 segments. A title within max_distance edits
+    of a query keeps one segment unchanged, shifted by at most max_distance
+    positions, so candidates are found with exact segment lookups and only
+    those are compared with edit_distance.
+    """
+
+    def __init__(self, max_distance=FUZZY_INDEX_DISTANCE):
+        """Fuzzy index init."""
+        self.max_distance = max_distance
+        self._segments = {}
+        self._short_titles = []
+
+    def _partition(self, length):
+        """Returns the (start, size) of the segments of a title length."""
+        count = self.max_distance + 1
+        size, longer = divmod(length, count)
+        segments = []
+        start = 0
+        for number in range(count):
+            segment_size = size + (number >= count - longer)
+            segments.append((start, segment_size))
+            start += segment_size
+        return segments
+
+    def add(self, title):
+        """Adds a distinct title to the index."""
+        if len(title) <= self.max_distance:
+            # Too short to have max_distance + 1 non-empty segments.
+            self._short_titles.append(title)
+            return
+        for number, (start, size) in enumerate(self._partition(len(title))):
+            segments = self._segments.setdefault((len(title), number), {})
+            segments.setdefault(title[start : start + size], []).append(title)
+
+    def search(self, query, max_distance):
+        """
+        Returns the (distance, title) pairs of the titles within
+        max_distance edits of query, closest first.
+        """
+        if max_distance > self.max_distance:
+            raise ValueError(f"Index built for distances up to {self.max_distance}")
+        candidates = {
+            title
+            for title in self._short_titles
+            if abs(len(title) - len(query)) <= max_distance
+        }
+        lengths = range(
+            max(len(query) - max_distance, self.max_distance + 1),
+            len(query) + max_distance + 1,
+        )
+        for length in lengths:
+            for number, (start, size) in enumerate(self._partition(length)):
+                segments = self._segments.get((length, number))
+                if segments is None:
+                    continue
+                last = min(start + max_distance, len(query) - size)
+                for position in range(max(start - max_distance, 0), last + 1):
+                    candidates.update(
+                        segments.get(query[position : position + size], ())
+                    )
+        matches = []
+        for title in candidates:
+            distance = edit_distance(query, title, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, title))
+        matches.sort()
+        return matches
+
+
 class BookStore:
     """
     Book store class.
     """
 
-    def __init__(self):
-        """Book class init."""
-        self.books = []
+    def __init__(self, books=None):
+        """
+        Book class init. books is the storage backend, a list by default or
+        a BookColumns instance for compact storage.
+        """
+        self.books = [] if books is None else books
+        # The search indexes map keys to row numbers. The title and author
+        # hash indexes are kept in sync by every addition, built in bulk for
+        # the initial books and for add_books. The sorted, token and fuzzy
+        # indexes are built on their first use, then catch up with the rows
+        # added since.
+        self._title_index = {}
+        self._author_index = {}
+        self._titles = []
+        self._hashed_rows = 0
+        self._sync_title_index()
+        self._sorted_titles = None
+        self._sorted_count = 0
+        self._token_index = None
+        self._tokenized_rows = 0
+        self._fuzzy_index = None
+        self._fuzzy_count = 0
+
+    def _fields(self, start):
+        """Yields the (title, author) pairs of the books from row start on."""
+        if isinstance(self.books, BookColumns):
+            return self.books.fields(start)
+        return (
+            (self.books[row].title, self.books[row].author)
+            for row in range(start, len(self.books))
+        )
+
+    def _sync_title_index(self):
+        """Updates the title and author hash indexes."""
+        rows = len(self.books)
+        if self._hashed_rows == rows:
+            # Searches call this under a shared read lock: with nothing to
+            # index, they must not touch the process-wide GC state.
+            return
+        with _gc_paused():
+            for row, (title, author) in enumerate(
+                self._fields(self._hashed_rows), self._hashed_rows
+            ):
+                title = title.casefold()
+                title_rows = self._title_index.get(title)
+                if title_rows is None:
+                    title_rows = self._title_index[title] = []
+                    self._titles.append(title)
+                title_rows.append(row)
+                self._author_index.setdefault(author.casefold(), []).append(row)
+        self._hashed_rows = rows
+
+    def _sync_sorted_titles(self):
+        """Updates the sorted array of distinct titles."""
+        self._sync_title_index()
+        if self._sorted_titles is None:
+            self._sorted_titles = []
+        new_titles = self._titles[self._sorted_count :]
+        if len(new_titles) == 1:
+            insort(self._sorted_titles, new_titles[0])
+        elif new_titles:
+            self._sorted_titles.extend(new_titles)
+            self._sorted_titles.sort()
+        self._sorted_count = len(self._titles)
+
+    def _sync_token_index(self):
+        """Updates the inverted index of title and author words."""
+        if self._token_index is None:
+            self._token_index = {}
+        rows = len(self.books)
+        if self._tokenized_rows == rows:
+            return
+        with _gc_paused():
+            for row, (title, author) in enumerate(
+                self._fields(self._tokenized_rows), self._tokenized_rows
+            ):
+                text = f"{title} {author}".casefold()
+                for token in dict.fromkeys(TOKEN_PATTERN.findall(text)):
+                    self._token_index.setdefault(token, []).append(row)
+        self._tokenized_rows = rows
+
+    def _sync_fuzzy_index(self, max_distance=FUZZY_INDEX_DISTANCE):
+        """Updates the fuzzy index, rebuilding it for larger distances."""
+        self._sync_title_index()
+        if self._fuzzy_index is None or self._fuzzy_index.max_distance < max_distance:
+            self._fuzzy_index = FuzzyIndex(max(FUZZY_INDEX_DISTANCE, max_distance))
+            self._fuzzy_count = 0
+        if self._fuzzy_count == len(self._titles):
+            return
+        with _gc_paused():
+            for title in islice(self._titles, self._fuzzy_count, None):
+                self._fuzzy_index.add(title)
+        self._fuzzy_count = len(self._titles)
+
+    def sync_indexes(self):
+        """Brings every index built so far up to date with the stored books."""
+        self._sync_title_index()
+        if self._sorted_titles is not None:
+            self._sync_sorted_titles()
+        if self._token_index is not None:
+            self._sync_token_index()
+        if self._fuzzy_index is not None:
+            self._sync_fuzzy_index(self._fuzzy_index.max_distance)
+
+    def _rows_to_books(self, rows):
+        """Returns the books stored at rows."""
+        return [self.books[row] for row in rows]
 
     def add_book(self, book):
         """Adds a book to the store."""
         self.books.append(book)
+        self._sync_title_index()
         print(f"Book '{book.title}' added to the store.")
 
+    def add_books(self, books):
+        """Adds many books to the store without printing, returns the count."""
+        count = 0
+        for book in books:
+            self.books.append(book)
+            count += 1
+        self._sync_title_index()
+        return count
+
+    def import_books(self, file, fmt="csv"):
+        """Adds the books read from a CSV or JSON Lines file."""
+        return self.add_books(read_books(file, fmt))
+
+    def find_by_title(self, title):
+        """Returns the books matching a title, ignoring case."""
+        self._sync_title_index()
+        return self._rows_to_books(self._title_index.get(title.casefold(), ()))
+
+    def find_by_author(self, author):
+        """Returns the books written by an author, ignoring case."""
+        self._sync_title_index()
+        return self._rows_to_books(self._author_index.get(author.casefold(), ()))
+
+    def search_prefix(self, prefix, limit=None):
+        """Returns the books whose title starts with prefix, ignoring case."""
+        self._sync_sorted_titles()
+        prefix = prefix.casefold()
+        rows = []
+        position = bisect_left(self._sorted_titles, prefix)
+        while position < len(self._sorted_titles):
+            title = self._sorted_titles[position]
+            if not title.startswith(prefix):
+                break
+            rows.extend(self._title_index[title])
+            if limit is not None and len(rows) >= limit:
+                return self._rows_to_books(rows[:limit])
+            position += 1
+        return self._rows_to_books(rows)
+
+    def search_text(self, query):
+        """Returns the books whose title or author contain every query word."""
+        tokens = TOKEN_PATTERN.findall(query.casefold())
+        if not tokens:
+            return []
+        self._sync_token_index()
+        postings = sorted(
+            (self._token_index.get(token, []) for token in set(tokens)), key=len
+        )
+        others = [set(posting) for posting in postings[1:]]
+        return self._rows_to_books(
+            row for row in postings[0] if all(row in posting for posting in others)
+        )
+
+    def search_fuzzy(self, title, max_distance=2):
+        """Returns the books whose title is within max_distance edits of title."""
+        self._sync_fuzzy_index(max_distance)
+        return self._rows_to_books(
+            row
+            for _, matched_title in self._fuzzy_index.search(
+                title.casefold(), max_distance
+            )
+            for row in self._title_index[matched_title]
+        )
+
     def display_books(self):
         """Displays all books available in the store."""
         if not self.books:
@@ -48,11 +627,19 @@ class BookStore:
             for book in self.books:
                 book.display()
 
+    def page_books(self, offset=0, limit=100):
+        """Returns limit books from offset on."""
+        return list(islice(self.books, offset, offset + limit))
+
+    def export_books(self, sink=None, fmt="text", offset=0, limit=None):
+        """Writes a page of the store books to sink, stdout by default."""
+        write_books(
+            self.books, sys.stdout if sink is None else sink, fmt, offset, limit
+        )
+
     def search_book(self, title):
         """Searches a books in the store."""
-        found_books = [
-            book for book in self.books if book.title.lower() == title.lower()
-        ]
+        found_books = self.find_by_title(title)
         if not found_books:
             print(f"No book found with title '{title}'.")
         else:
@@ -67,7 +654,8 @@ def main():
 
     while True:
         print(
-            "\n1. Display all books\n2. Search for a book\n3. Add a new book\n4. Exit"
+            "\n1. Display all books\n2. Search for a book\n3. Add a new book"
+            "\n4. Exit\n5. Search by title prefix"
         )
         choice = input("Enter your choice: ")
 
@@ -86,5 +674,12 @@ def main():
         elif choice == "4":
             print("Exiting...")
             break
+        elif choice == "5":
+            prefix = input("Enter the beginning of the title: ")
+            found_books = bookstore.search_prefix(prefix)
+            if not found_books:
+                print(f"No book found starting with '{prefix}'.")
+            for book in found_books:
+                book.display()
         else:
             print("Invalid choice. Please try again.")
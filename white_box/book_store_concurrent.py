@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+Thread-safe book store example.
+"""
+import threading
+from contextlib import contextmanager
+
+from white_box.book_store import BookStore
+
+
+class ReadWriteLock:
+    """
+    Lock shared by many readers or held by one writer. Waiting writers go
+    first, so a steady stream of readers cannot starve them.
+    """
+
+    def __init__(self):
+        """Read write lock init."""
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self):
+        """Holds the lock for reading."""
+        with self._condition:
+            while self._writing or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self):
+        """Holds the lock for writing."""
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writing or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+class ConcurrentBookStore(BookStore):
+    """
+    Book store that can be searched from many threads while other threads
+    add books. Searches share a read lock, additions take the write lock and
+    bring the indexes built so far up to date, so searches never change
+    them. A search that needs a lazy index that is not built yet takes the
+    write lock once to build it.
+    """
+
+    def __init__(self, books=None):
+        """Concurrent book store init."""
+        self.lock = ReadWriteLock()
+        super().__init__(books)
+
+    def _read(self, ready, method, *args):
+        """Runs a search under the read lock once ready() is true."""
+        with self.lock.read():
+            if ready():
+                return method(*args)
+        with self.lock.write():
+            return method(*args)
+
+    def add_book(self, book):
+        """Adds a book to the store."""
+        with self.lock.write():
+            super().add_book(book)
+            self.sync_indexes()
+
+    def add_books(self, books):
+        """Adds many books to the store without printing."""
+        books = list(books)
+        with self.lock.write():
+            count = super().add_books(books)
+            self.sync_indexes()
+            return count
+
+    def _has_title_index(self):
+        """Returns whether the title and author indexes hold every row."""
+        return self._hashed_rows == len(self.books)
+
+    def find_by_title(self, title):
+        """Returns the books matching a title, ignoring case."""
+        return self._read(self._has_title_index, super().find_by_title, title)
+
+    def find_by_author(self, author):
+        """Returns the books written by an author, ignoring case."""
+        return self._read(self._has_title_index, super().find_by_author, author)
+
+    def search_prefix(self, prefix, limit=None):
+        """Returns the books whose title starts with prefix, ignoring case."""
+        return self._read(
+            lambda: self._sorted_titles is not None,
+            super().search_prefix,
+            prefix,
+            limit,
+        )
+
+    def search_text(self, query):
+        """Returns the books whose title or author contain every query word."""
+        return self._read(
+            lambda: self._token_index is not None, super().search_text, query
+        )
+
+    def search_fuzzy(self, title, max_distance=2):
+        """Returns the books whose title is within max_distance edits of title."""
+        return self._read(
+            lambda: self._fuzzy_index is not None
+            and self._fuzzy_index.max_distance >= max_distance,
+            super().search_fuzzy,
+            title,
+            max_distance,
+        )
+
+    def display_books(self):
+        """Displays all books available in the store."""
+        with self.lock.read():
+            super().display_books()
+
+    def page_books(self, offset=0, limit=100):
+        """Returns limit books from offset on."""
+        with self.lock.read():
+            return super().page_books(offset, limit)
+
+    def export_books(self, sink=None, fmt="text", offset=0, limit=None):
+        """Writes a page of the store books to sink, stdout by default."""
+        with self.lock.read():
+            super().export_books(sink, fmt, offset, limit)
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""
+Book store example backed by SQLite.
+"""
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from white_box.book_store import Book
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS books (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    price REAL NOT NULL,
+    quantity INTEGER NOT NULL,
+    title_key TEXT NOT NULL,
+    author_key TEXT NOT NULL
+)
+"""
+CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS books_title_key ON books (title_key)",
+    "CREATE INDEX IF NOT EXISTS books_author_key ON books (author_key)",
+)
+INSERT_BOOK = (
+    "INSERT INTO books (title, author, price, quantity, title_key, author_key)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+SELECT_BOOKS = "SELECT title, author, price, quantity FROM books ORDER BY id"
+SELECT_BY_TITLE = (
+    "SELECT title, author, price, quantity FROM books"
+    " WHERE title_key = ? ORDER BY id"
+)
+SELECT_BY_AUTHOR = (
+    "SELECT title, author, price, quantity FROM books"
+    " WHERE author_key = ? ORDER BY id"
+)
+COUNT_BOOKS = "SELECT COUNT(*) FROM books"
+
+
+def _book_row(book):
+    """Returns the insert parameters of a book."""
+    return (
+        book.title,
+        book.author,
+        book.price,
+        book.quantity,
+        book.title.casefold(),
+        book.author.casefold(),
+    )
+
+
+class SQLiteBookStore:
+    """
+    Book store with the BookStore API that keeps its catalog in a SQLite
+    database file. Writes go through one connection, reads through a small
+    pool of connections so concurrent readers do not wait for each other.
+    """
+
+    def __init__(self, path, readers=4):
+        """
+        Opens the database, creating the schema if needed. Every pooled
+        connection must see the same database, so path must name a file:
+        in-memory and temporary databases are private to one connection.
+        """
+        if path in (":memory:", ""):
+            raise ValueError("SQLiteBookStore needs a database file path")
+        self.path = path
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute(CREATE_TABLE)
+        for statement in CREATE_INDEXES:
+            self._writer.execute(statement)
+        self._writer.commit()
+        self._write_lock = threading.Lock()
+        self._readers = queue.Queue()
+        for _ in range(readers):
+            self._readers.put(self._connect())
+
+    def _connect(self):
+        """Opens a connection that may be used from any thread."""
+        return sqlite3.connect(self.path, check_same_thread=False)
+
+    @contextmanager
+    def _reader(self):
+        """Borrows a reader connection from the pool."""
+        connection = self._readers.get()
+        try:
+            yield connection
+        finally:
+            self._readers.put(connection)
+
+    def _query(self, statement, parameters=()):
+        """Returns the books selected by a query."""
+        with self._reader() as connection:
+            rows = connection.execute(statement, parameters).fetchall()
+        return [Book(*row) for row in rows]
+
+    @property
+    def books(self):
+        """Returns every book in the store."""
+        return self._query(SELECT_BOOKS)
+
+    def __len__(self):
+        with self._reader() as connection:
+            return connection.execute(COUNT_BOOKS).fetchone()[0]
+
+    def add_book(self, book):
+        """Adds a book to the store."""
+        with self._write_lock, self._writer:
+            self._writer.execute(INSERT_BOOK, _book_row(book))
+        print(f"Book '{book.title}' added to the store.")
+
+    def add_books(self, books):
+        """Adds many books in one transaction without printing."""
+        with self._write_lock, self._writer:
+            cursor = self._writer.executemany(INSERT_BOOK, map(_book_row, books))
+        return cursor.rowcount
+
+    def find_by_title(self, title):
+        """Returns the books matching a title, ignoring case."""
+        return self._query(SELECT_BY_TITLE, (title.casefold(),))
+
+    def find_by_author(self, author):
+        """Returns the books written by an author, ignoring case."""
+        return self._query(SELECT_BY_AUTHOR, (author.casefold(),))
+
+    def display_books(self):
+        """Displays all books available in the store."""
+        with self._reader() as connection:
+            rows = connection.execute(SELECT_BOOKS)
+            first = rows.fetchone()
+            if first is None:
+                print("No books in the store.")
+                return
+            print("Books available in the store:")
+            Book(*first).display()
+            for row in rows:
+                Book(*row).display()
+
+    def search_book(self, title):
+        """Searches a books in the store."""
+        found_books = self.find_by_title(title)
+        if not found_books:
+            print(f"No book found with title '{title}'.")
+        else:
+            print(f"Found {len(found_books)} book(s) with title '{title}':")
+            for book in found_books:
+                book.display()
+
+    def close(self):
+        """Closes every connection."""
+        self._writer.close()
+        while not self._readers.empty():
+            self._readers.get().close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -3,7 +3,18 @@
 """
 White-box code examples.
 """
-import re
+import math
+
+from white_box.rule_tables import (
+    GRADE_TABLE,
+    LOAN_ELIGIBILITY_TABLE,
+    PRODUCT_CATEGORY_TABLE,
+    QUANTITY_DISCOUNT_FACTORS,
+    QUANTITY_DISCOUNT_TABLE,
+    QUIZ_TABLE,
+    WEATHER_ADVISORY_TABLE,
+)
+from white_box.validators import check_password, is_valid_date, parse_url
 
 
 def is_even(num):
@@ -27,15 +38,7 @@ def get_grade(score):
     """
     Grade function.
     """
-    if score >= 90:
-        grade = "A"
-    elif score >= 80:
-        grade = "B"
-    elif score >= 70:
-        grade = "C"
-    else:
-        grade = "F"
-    return grade
+    return GRADE_TABLE.classify(score)
 
 
 def is_triangle(a, b, c):
@@ -66,22 +69,9 @@ def check_number_status(number):
 def validate_password(password):
     """
     Validates user passwords.
+    The checks run in a single pass, see validators.check_password.
     """
-    # Check length
-    if len(password) < 8:
-        return False
-
-    # Check for at least one uppercase letter, one lowercase letter,
-    # one digit, and one special character.
-    if (
-        not re.search(r"[A-Z]", password)
-        or not re.search(r"[a-z]", password)
-        or not re.search(r"\d", password)
-        or not re.search(r"[!@#$%&]", password)
-    ):
-        return False
-
-    return True
+    return not check_password(password)
 
 
 # 3
@@ -112,12 +102,12 @@ def calculate_order_total(items):
         price_per_item = item["price"]
 
         # Apply discounts based on quantity
-        if 1 <= quantity <= 5:
+        factor = QUANTITY_DISCOUNT_FACTORS[QUANTITY_DISCOUNT_TABLE.classify(quantity)]
+        if factor == 1:
+            # Undiscounted lines keep the type of the price (int, Decimal...).
             total_price += quantity * price_per_item
-        elif 6 <= quantity <= 10:
-            total_price += 0.95 * quantity * price_per_item  # 5% discount
         else:
-            total_price += 0.9 * quantity * price_per_item  # 10% discount
+            total_price += factor * quantity * price_per_item
 
     return total_price
 
@@ -178,17 +168,9 @@ def verify_age(age):
 def categorize_product(price):
     """
     Determines the price category of a product based on its price.
+    Bands are half-open, so fractional prices such as 50.5 keep their band.
     """
-    if 10 <= price <= 50:
-        return "Category A"
-
-    if 51 <= price <= 100:
-        return "Category B"
-
-    if 101 <= price <= 200:
-        return "Category C"
-
-    return "Category D"
+    return PRODUCT_CATEGORY_TABLE.classify(price)
 
 
 # 9
@@ -227,9 +209,9 @@ def validate_credit_card(card_number):
 # 12
 def validate_date(year, month, day):
     """
-    Validates dates.
+    Validates dates, including month lengths and leap years.
     """
-    if 1900 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31:
+    if is_valid_date(year, month, day):
         return "Valid Date"
 
     return "Invalid Date"
@@ -251,7 +233,7 @@ def validate_url(url):
     """
     Validates URLs.
     """
-    if len(url) <= 255 and url.startswith("http://") or url.startswith("https://"):
+    if parse_url(url) is not None:
         return "Valid URL"
 
     return "Invalid URL"
@@ -262,13 +244,7 @@ def calculate_quantity_discount(quantity):
     """
     Calculates discounts based on the quantity of a product.
     """
-    if 1 <= quantity <= 5:
-        return "No Discount"
-
-    if 6 <= quantity <= 10:
-        return "5% Discount"
-
-    return "10% Discount"
+    return QUANTITY_DISCOUNT_TABLE.classify(quantity)
 
 
 # 16
@@ -287,19 +263,7 @@ def check_loan_eligibility(income, credit_score):
     """
     Checks if and which loan can be granted based on the income and credit score.
     """
-    if income < 30000:
-        return "Not Eligible"
-
-    if 30000 <= income <= 60000:
-        if credit_score > 700:
-            return "Standard Loan"
-
-        return "Secured Loan"
-
-    if credit_score > 750:
-        return "Premium Loan"
-
-    return "Standard Loan"
+    return LOAN_ELIGIBILITY_TABLE.classify(income, credit_score)
 
 
 # 18
@@ -326,13 +290,7 @@ def grade_quiz(correct_answers, incorrect_answers):
     """
     Grades online quizzes based on the number of correct and incorrect answers.
     """
-    if correct_answers >= 7 and incorrect_answers <= 2:
-        return "Pass"
-
-    if correct_answers >= 5 and incorrect_answers <= 3:
-        return "Conditional Pass"
-
-    return "Fail"
+    return QUIZ_TABLE.classify(correct_answers, incorrect_answers)
 
 
 # 20
@@ -354,13 +312,7 @@ def get_weather_advisory(temperature, humidity):
     """
     Provides weather advisories based on temperature and humidity.
     """
-    if temperature > 30 and humidity > 70:
-        return "High Temperature and Humidity. Stay Hydrated."
-
-    if temperature < 0:
-        return "Low Temperature. Bundle Up!"
-
-    return "No Specific Advisory"
+    return WEATHER_ADVISORY_TABLE.classify(temperature, humidity)
 
 
 # 22
@@ -642,40 +594,117 @@ class ShoppingCart:
     Shopping cart class.
     """
 
-    def __init__(self):
+    def __init__(self, check_consistency=False):
         """
         Initialize the shopping cart.
+        Cart lines are indexed by product; dicts keep their insertion order.
+        Each line keeps its amount, price * quantity at its last change, and
+        the subtotal is kept up to date as the exact sum of the line amounts,
+        so it does not drift however many changes are made. With
+        check_consistency, every change also compares it with a full
+        recomputation from the current prices.
+        """
+        self._lines = {}
+        self._partials = []
+        self.check_consistency = check_consistency
+
+    @property
+    def items(self):
+        """
+        Copies of the cart lines, in the order the products were first added.
+        """
+        return [dict(line) for line in self._lines.values()]
+
+    @property
+    def subtotal(self):
+        """
+        Sum of the line amounts. It keeps the type of the prices when the sum
+        is exact in that type, e.g. int prices give an int.
+        """
+        if len(self._partials) > 1:
+            return math.fsum(self._partials)
+        return self._partials[0] if self._partials else 0
+
+    @property
+    def line_count(self):
+        """
+        Number of distinct products in the cart.
         """
-        self.items = []
+        return len(self._lines)
+
+    def _add_to_subtotal(self, amount):
+        """
+        Adds amount to the subtotal, kept as non-overlapping partial sums so
+        no rounding error is lost (the algorithm math.fsum uses).
+        """
+        if not amount:
+            return
+        count = 0
+        for partial in self._partials:
+            if abs(amount) < abs(partial):
+                amount, partial = partial, amount
+            high = amount + partial
+            low = partial - (high - amount)
+            if low:
+                self._partials[count] = low
+                count += 1
+            amount = high
+        self._partials[count:] = [amount] if amount else []
+
+    def _update_line(self, product, quantity):
+        """
+        Sets the quantity of a product, removing its line at zero, and moves
+        the subtotal from the stored line amount to the new one, so a price
+        changed since the last change of the line is picked up.
+        """
+        line = self._lines[product]
+        self._add_to_subtotal(-line["amount"])
+        if quantity:
+            line["quantity"] = quantity
+            line["amount"] = product.price * quantity
+            self._add_to_subtotal(line["amount"])
+        else:
+            del self._lines[product]
+        if not self._lines:
+            self._partials = []
+
+        if self.check_consistency:
+            expected = math.fsum(
+                item["product"].price * item["quantity"]
+                for item in self._lines.values()
+            )
+            if math.fsum(self._partials) != expected:
+                raise AssertionError(
+                    f"Cart subtotal {self.subtotal} does not match {expected}"
+                )
 
     def add_product(self, product, quantity=1):
         """
         Function to add a product to the shopping cart.
         """
-        for item in self.items:
-            if item["product"] == product:
-                item["quantity"] += quantity
-                break
-        else:
-            self.items.append({"product": product, "quantity": quantity})
+        line = self._lines.get(product)
+        if line is None:
+            line = self._lines[product] = {
+                "product": product,
+                "quantity": 0,
+                "amount": 0,
+            }
+        self._update_line(product, line["quantity"] + quantity)
 
     def remove_product(self, product, quantity=1):
         """
         Function to remove a product from the shopping cart.
         """
-        for item in self.items:
-            if item["product"] == product:
-                if item["quantity"] <= quantity:
-                    self.items.remove(item)
-                else:
-                    item["quantity"] -= quantity
-                break
+        line = self._lines.get(product)
+        if line is None:
+            return
+        self._update_line(product, max(line["quantity"] - quantity, 0))
 
     def view_cart(self):
         """
         Function to display the shopping cart content.
         """
-        for item in self.items:
+        for item in self._lines.values():
             print(
                 f"{item['quantity']} x {item['product'].name}"
                 f" - ${item['product'].price * item['quantity']}"
@@ -685,6 +714,5 @@ class ShoppingCart:
         """
         Function to checkout the items from the shopping cart.
         """
-        total = sum(item["product"].price * item["quantity"] for item in self.items)
-        print(f"Total: ${total}")
+        print(f"Total: ${self.subtotal}")
         print("Checkout completed. Thank you for shopping!")
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+Batch loan eligibility scoring. Applications are scored column-wise into
+one signed byte per application, the index of its category in
+LOAN_CATEGORIES, with the decision matrix of LOAN_ELIGIBILITY_TABLE.
+"""
+import csv
+import os
+from array import array
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from white_box.rule_tables import LOAN_ELIGIBILITY_TABLE, RuleTable
+
+LOAN_CATEGORIES = ("Not Eligible", "Secured Loan", "Standard Loan", "Premium Loan")
+LOAN_CODES = {category: code for code, category in enumerate(LOAN_CATEGORIES)}
+LoanScores = namedtuple("LoanScores", ["codes", "counts"])
+
+
+def _compile_matrix(table):
+    """
+    Returns, for each income band of table, the credit score table (or None)
+    and the codes of its score bands.
+    """
+    matrix = []
+    for label in table.labels:
+        if isinstance(label, RuleTable):
+            matrix.append((label, [LOAN_CODES[category] for category in label.labels]))
+        else:
+            matrix.append((None, [LOAN_CODES[label]]))
+    return matrix
+
+
+_MATRIX = _compile_matrix(LOAN_ELIGIBILITY_TABLE)
+
+
+def score_applications(incomes, credit_scores):
+    """
+    Scores columns of incomes and credit scores. Returns an array('b') of
+    category codes, one per application.
+    """
+    codes = array("b")
+    income_band = LOAN_ELIGIBILITY_TABLE.index
+    for income, credit_score in zip(incomes, credit_scores):
+        score_table, band_codes = _MATRIX[income_band(income)]
+        codes.append(
+            band_codes[0]
+            if score_table is None
+            else band_codes[score_table.index(credit_score)]
+        )
+    return codes
+
+
+def category_counts(codes):
+    """Returns the number of applications of each category in codes."""
+    return {category: codes.count(code) for category, code in LOAN_CODES.items()}
+
+
+def _read_header(path):
+    """
+    Returns the income and credit score column positions and the header size
+    in bytes. A UTF-8 byte order mark before the header is skipped.
+    """
+    with open(path, "rb") as file:
+        header = file.readline()
+    fields = next(csv.reader([header.decode("utf-8-sig").strip()]))
+    try:
+        return fields.index("income"), fields.index("credit_score"), len(header)
+    except ValueError as error:
+        raise ValueError("Expected income and credit_score columns") from error
+
+
+def _ranges(path, start, chunk_bytes):
+    """Yields (start, end) byte ranges of whole lines from start to the end."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        while start < size:
+            file.seek(start + chunk_bytes)
+            file.readline()
+            end = min(file.tell(), size)
+            yield start, end
+            start = end
+
+
+def _score_range(path, start, end, income_column, score_column):
+    """
+    Scores the applications in a byte range of a CSV file. Rows are parsed
+    with csv.reader, so quoted fields may hold commas; they may not hold
+    line breaks, since ranges are split at line ends.
+    """
+    incomes = []
+    credit_scores = []
+    with open(path, "rb") as file:
+        file.seek(start)
+        lines = file.read(end - start).decode("utf-8").splitlines()
+    for row in csv.reader(line for line in lines if line.strip()):
+        incomes.append(float(row[income_column]))
+        credit_scores.append(float(row[score_column]))
+    return score_applications(incomes, credit_scores)
+
+
+def score_file(path, output=None, workers=None, chunk_bytes=1 << 24):
+    """
+    Scores a CSV file with income and credit_score columns, in ranges of
+    about chunk_bytes bytes, so files bigger than memory can be scored.
+    With workers, ranges are scored on a process pool, at most two per
+    worker at a time. The codes are written to output, a binary file, when
+    given and returned otherwise. Returns LoanScores with the codes (None
+    when written to output) and the category counts.
+    """
+    income_column, score_column, header_size = _read_header(path)
+    codes = None if output is not None else array("b")
+    counts = dict.fromkeys(LOAN_CATEGORIES, 0)
+
+    def collect(range_codes):
+        """Adds the codes of a range to the results."""
+        for category, count in category_counts(range_codes).items():
+            counts[category] += count
+        if output is not None:
+            range_codes.tofile(output)
+        else:
+            codes.extend(range_codes)
+
+    ranges = _ranges(path, header_size, chunk_bytes)
+    if not workers:
+        for start, end in ranges:
+            collect(_score_range(path, start, end, income_column, score_column))
+        return LoanScores(codes, counts)
+
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for start, end in ranges:
+            if len(pending) >= 2 * workers:
+                collect(pending.popleft().result())
+            pending.append(
+                executor.submit(
+                    _score_range, path, start, end, income_column, score_column
+                )
+            )
+        while pending:
+            collect(pending.popleft().result())
+    return LoanScores(codes, counts)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""
+Streaming order processing: every stage is a generator, so only one order
+is held in memory at a time whatever the size of the input.
+"""
+import csv
+import json
+from itertools import groupby
+
+from white_box.class_exercises import (
+    calculate_items_shipping_cost,
+    calculate_order_total,
+    calculate_total_discount,
+)
+
+RESULT_FIELDS = ("id", "total", "discount", "shipping")
+
+
+def read_orders_jsonl(file):
+    """
+    Yields the orders of a JSON Lines file, one object per line with "id",
+    "items" (dicts with "quantity", "price" and "weight") and optionally
+    "shipping_method".
+    """
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def read_orders_csv(file):
+    """
+    Yields the orders of a CSV file with one line item per row and the
+    columns id, quantity, price, weight and shipping_method. Rows of the
+    same order must be consecutive.
+    """
+    for order_id, rows in groupby(csv.DictReader(file), key=lambda row: row["id"]):
+        rows = list(rows)
+        yield {
+            "id": order_id,
+            "shipping_method": rows[0]["shipping_method"],
+            "items": [
+                {
+                    "quantity": int(row["quantity"]),
+                    "price": float(row["price"]),
+                    "weight": float(row["weight"]),
+                }
+                for row in rows
+            ],
+        }
+
+
+def price_orders(orders):
+    """Stage: adds the calculate_order_total "total" of each order."""
+    for order in orders:
+        order["total"] = calculate_order_total(order["items"])
+        yield order
+
+
+def discount_orders(orders):
+    """Stage: adds the calculate_total_discount "discount" of each order."""
+    for order in orders:
+        order["discount"] = calculate_total_discount(order["total"])
+        yield order
+
+
+def ship_orders(orders, default_method="standard"):
+    """Stage: adds the calculate_items_shipping_cost "shipping" of each order."""
+    for order in orders:
+        order["shipping"] = calculate_items_shipping_cost(
+            order["items"], order.get("shipping_method") or default_method
+        )
+        yield order
+
+
+def compose(orders, *stages):
+    """Chains the stages over an order stream and returns the final stream."""
+    for stage in stages:
+        orders = stage(orders)
+    return orders
+
+
+def write_results(orders, sink, fields=RESULT_FIELDS):
+    """
+    Writes one JSON line per order with the given fields and returns the
+    number of orders written.
+    """
+    count = 0
+    for count, order in enumerate(orders, 1):
+        sink.write(json.dumps({field: order.get(field) for field in fields}) + "\n")
+    return count
+
+
+def process_orders(file, sink, fmt="jsonl"):
+    """
+    Reads the orders of a JSON Lines or CSV file, prices, discounts and ships
+    them, and writes the results to sink as they are produced.
+    """
+    if fmt == "jsonl":
+        orders = read_orders_jsonl(file)
+    elif fmt == "csv":
+        orders = read_orders_csv(file)
+    else:
+        raise ValueError(f"Invalid format '{fmt}'")
+    return write_results(
+        compose(orders, price_orders, discount_orders, ship_orders), sink
+    )
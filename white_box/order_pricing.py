@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+Batch order pricing over columnar inputs.
+"""
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from white_box.class_exercises import calculate_total_discount
+from white_box.rule_tables import QUANTITY_DISCOUNT_FACTORS, QUANTITY_DISCOUNT_TABLE
+
+PricingResult = namedtuple(
+    "PricingResult", ["totals", "discounts", "total", "discount"]
+)
+
+
+def orders_to_columns(orders):
+    """
+    Converts orders in the calculate_order_total format (lists of item dicts)
+    into quantities, prices and offsets columns. Order k is made of the lines
+    offsets[k] to offsets[k + 1].
+    """
+    quantities = array("q")
+    prices = array("d")
+    offsets = array("q", [0])
+    for items in orders:
+        for item in items:
+            quantities.append(item["quantity"])
+            prices.append(item["price"])
+        offsets.append(len(quantities))
+    return quantities, prices, offsets
+
+
+def quantity_discount_factor(quantity):
+    """
+    Returns the price factor of the QUANTITY_DISCOUNT_TABLE tier of a
+    quantity, the tiers used by calculate_order_total.
+    """
+    return QUANTITY_DISCOUNT_FACTORS[QUANTITY_DISCOUNT_TABLE.classify(quantity)]
+
+
+def calculate_line_amounts(quantities, prices):
+    """
+    Applies the quantity tiers to every line at once and returns the
+    discounted line amounts. factor * quantity * price is evaluated in the
+    same order as the scalar function, so the amounts are identical.
+    """
+    band_factors = [
+        QUANTITY_DISCOUNT_FACTORS[label] for label in QUANTITY_DISCOUNT_TABLE.labels
+    ]
+    return array(
+        "d",
+        [
+            band_factors[band] * quantity * price
+            for band, quantity, price in zip(
+                map(QUANTITY_DISCOUNT_TABLE.index, quantities), quantities, prices
+            )
+        ],
+    )
+
+
+def calculate_order_totals(quantities, prices, offsets):
+    """
+    Batch version of calculate_order_total: returns one total per order,
+    adding the line amounts in the same order as the scalar function so the
+    results are identical.
+    """
+    amounts = calculate_line_amounts(quantities, prices)
+    totals = array("d")
+    for start, end in zip(offsets, offsets[1:]):
+        total = 0
+        for amount in amounts[start:end]:
+            total += amount
+        totals.append(total)
+    return totals
+
+
+def _price_orders(quantities, prices, offsets):
+    """Returns the order totals and their calculate_total_discount discounts."""
+    totals = calculate_order_totals(quantities, prices, offsets)
+    return totals, array("d", map(calculate_total_discount, totals))
+
+
+def _share(column):
+    """Copies an array column into a new shared memory block."""
+    data = column.tobytes()
+    block = SharedMemory(create=True, size=max(len(data), 1))
+    block.buf[: len(data)] = data
+    return block
+
+
+def _read_shared(name, typecode, first, last):
+    """Copies items first to last of an array stored in shared memory."""
+    block = SharedMemory(name=name)
+    try:
+        itemsize = array(typecode).itemsize
+        view = block.buf[first * itemsize : last * itemsize]
+        column = array(typecode, view.cast(typecode))
+        view.release()
+        return column
+    finally:
+        block.close()
+
+
+def _price_shard(names, first, last):
+    """
+    Worker: prices orders first to last, reading the columns from the shared
+    memory blocks named in names.
+    """
+    quantities_name, prices_name, offsets_name = names
+    offsets = _read_shared(offsets_name, "q", first, last + 1)
+    start, end = offsets[0], offsets[-1]
+    totals, discounts = _price_orders(
+        _read_shared(quantities_name, "q", start, end),
+        _read_shared(prices_name, "d", start, end),
+        [offset - start for offset in offsets],
+    )
+    return totals.tobytes(), discounts.tobytes()
+
+
+def price_orders_parallel(quantities, prices, offsets, workers=None, chunk_size=10000):
+    """
+    Prices the orders described by the quantities, prices and offsets columns
+    on a pool of worker processes, chunk_size orders per shard. The columns
+    are handed to the workers through shared memory instead of being pickled,
+    and the per-shard results are reduced into one PricingResult.
+    """
+    quantities = array("q", quantities)
+    prices = array("d", prices)
+    offsets = array("q", offsets)
+    order_count = len(offsets) - 1
+    if workers == 1 or order_count <= chunk_size:
+        totals, discounts = _price_orders(quantities, prices, offsets)
+        return PricingResult(totals, discounts, sum(totals), sum(discounts))
+
+    blocks = [_share(quantities), _share(prices), _share(offsets)]
+    names = [block.name for block in blocks]
+    totals = array("d")
+    discounts = array("d")
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shards = [
+                executor.submit(
+                    _price_shard, names, first, min(first + chunk_size, order_count)
+                )
+                for first in range(0, order_count, chunk_size)
+            ]
+            for shard in shards:
+                shard_totals, shard_discounts = shard.result()
+                totals.frombytes(shard_totals)
+                discounts.frombytes(shard_discounts)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return PricingResult(totals, discounts, sum(totals), sum(discounts))
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+Rule tables: threshold classifiers declared as data and compiled into
+sorted boundary arrays searched with bisect.
+"""
+from bisect import bisect_right
+from collections import Counter
+
+_OPERATORS = {">=": 0, ">": 1}
+
+
+class RuleTable:
+    """
+    Threshold classifier. A value gets first_label, then the label of every
+    step whose condition it meets, in ascending order; the last one wins.
+    Steps are (operator, bound, label) with operator ">=" or ">". A label may
+    itself be a RuleTable, which then classifies the next value, so tables
+    over several inputs are built by nesting.
+    """
+
+    def __init__(self, first_label, steps=()):
+        """Compiles the steps into a sorted boundary array."""
+        self.labels = [first_label]
+        self._keys = []
+        for operator, bound, label in steps:
+            if operator not in _OPERATORS:
+                raise ValueError(f"Invalid operator '{operator}'")
+            # (bound, 0) sorts before (bound, 1), so a value equal to bound
+            # meets ">=" but not ">".
+            key = (bound, _OPERATORS[operator])
+            if self._keys and key <= self._keys[-1]:
+                raise ValueError("Steps must be in ascending order")
+            self._keys.append(key)
+            self.labels.append(label)
+
+    def index(self, value):
+        """Returns the position of the band holding value."""
+        return bisect_right(self._keys, (value, 0))
+
+    def classify(self, value, *values):
+        """Returns the label of value, classifying values with nested tables."""
+        label = self.labels[self.index(value)]
+        if isinstance(label, RuleTable):
+            return label.classify(*values)
+        return label
+
+    def classify_many(self, *columns):
+        """Classifies columns of values, one row per position."""
+        return [self.classify(*row) for row in zip(*columns)]
+
+
+class BandCounter:
+    """
+    Keeps the number of items in each band of a RuleTable up to date as
+    item values are set, changed or removed, without rescanning the items.
+    """
+
+    def __init__(self, table):
+        """Band counter init."""
+        self.table = table
+        self.counts = Counter()
+        self._labels = {}
+
+    def set(self, key, *values):
+        """Sets the values of an item and moves it to its new band."""
+        label = self.table.classify(*values)
+        previous = self._labels.get(key)
+        if previous != label:
+            if key in self._labels:
+                self.counts[previous] -= 1
+            self.counts[label] += 1
+            self._labels[key] = label
+        return label
+
+    def remove(self, key):
+        """Removes an item from its band."""
+        self.counts[self._labels.pop(key)] -= 1
+
+    def label(self, key):
+        """Returns the band label of an item."""
+        return self._labels[key]
+
+
+GRADE_TABLE = RuleTable("F", [(">=", 70, "C"), (">=", 80, "B"), (">=", 90, "A")])
+
+# Half-open price bands [10, 51), [51, 101) and [101, 201): whole prices
+# keep the 10-50 / 51-100 / 101-200 categories and fractional prices in
+# between no longer fall through to Category D.
+PRODUCT_CATEGORY_TABLE = RuleTable(
+    "Category D",
+    [
+        (">=", 10, "Category A"),
+        (">=", 51, "Category B"),
+        (">=", 101, "Category C"),
+        (">=", 201, "Category D"),
+    ],
+)
+
+QUANTITY_DISCOUNT_TABLE = RuleTable(
+    "10% Discount",
+    [
+        (">=", 1, "No Discount"),
+        (">", 5, "10% Discount"),
+        (">=", 6, "5% Discount"),
+        (">", 10, "10% Discount"),
+    ],
+)
+
+# Price factor of each QUANTITY_DISCOUNT_TABLE label.
+QUANTITY_DISCOUNT_FACTORS = {
+    "No Discount": 1.0,
+    "5% Discount": 0.95,
+    "10% Discount": 0.9,
+}
+
+# Income first, then credit score.
+LOAN_ELIGIBILITY_TABLE = RuleTable(
+    "Not Eligible",
+    [
+        (">=", 30000, RuleTable("Secured Loan", [(">", 700, "Standard Loan")])),
+        (">", 60000, RuleTable("Standard Loan", [(">", 750, "Premium Loan")])),
+    ],
+)
+
+# Temperature first, then humidity.
+WEATHER_ADVISORY_TABLE = RuleTable(
+    "Low Temperature. Bundle Up!",
+    [
+        (">=", 0, "No Specific Advisory"),
+        (
+            ">",
+            30,
+            RuleTable(
+                "No Specific Advisory",
+                [(">", 70, "High Temperature and Humidity. Stay Hydrated.")],
+            ),
+        ),
+    ],
+)
+
+# Correct answers first, then incorrect answers.
+QUIZ_TABLE = RuleTable(
+    "Fail",
+    [
+        (">=", 5, RuleTable("Conditional Pass", [(">", 3, "Fail")])),
+        (
+            ">=",
+            7,
+            RuleTable("Pass", [(">", 2, "Conditional Pass"), (">", 3, "Fail")]),
+        ),
+    ],
+)
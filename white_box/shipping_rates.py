@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""
+Data-driven shipping rates. Rate tables are plain data (a dict, or a JSON
+file) compiled into sorted boundary arrays searched with bisect. A table
+may define methods beyond the ShippingMethod members; they are looked up
+by their config name.
+"""
+import json
+from bisect import bisect_left, bisect_right
+from enum import Enum
+
+
+class ShippingMethod(Enum):
+    """
+    Built-in shipping methods.
+    """
+
+    STANDARD = "standard"
+    EXPRESS = "express"
+
+
+# Same rates as calculate_items_shipping_cost and calculate_shipping_cost.
+# Weight limits are inclusive upper bounds: band i holds the weights above
+# limit i - 1 and up to limit i; the last band holds everything heavier.
+DEFAULT_RATES = {
+    "methods": {
+        "standard": {"weight_limits": [5, 10], "costs": [10, 15, 20]},
+        "express": {"weight_limits": [5, 10], "costs": [20, 30, 40]},
+    },
+    "parcel": {
+        "weight_limits": [1, 5],
+        "dimension_bands": [[None, 10], [11, 30]],
+        "rates": [[0, 0, 5], [1, 1, 10]],
+        "default": 20,
+    },
+}
+
+
+def _ascending_limits(limits, name):
+    """
+    Returns the weight limits as a list, raising ValueError unless they are
+    in strictly ascending order: costs are matched to limits by position.
+    """
+    limits = list(limits)
+    if any(low >= high for low, high in zip(limits, limits[1:])):
+        raise ValueError(f"Weight limits must be in ascending order for '{name}'")
+    return limits
+
+
+class RateTable:
+    """
+    Compiled shipping rate table.
+    """
+
+    def __init__(self, config=None):
+        """
+        Compiles a rate table in the DEFAULT_RATES format. Methods are keyed
+        by their config name, so new methods need no code change.
+        """
+        config = DEFAULT_RATES if config is None else config
+        self._methods = {}
+        for name, rates in config["methods"].items():
+            if len(rates["costs"]) != len(rates["weight_limits"]) + 1:
+                raise ValueError(f"Expected one more cost than limits for '{name}'")
+            self._methods[name] = (
+                _ascending_limits(rates["weight_limits"], name),
+                list(rates["costs"]),
+            )
+
+        parcel = config["parcel"]
+        self._parcel_limits = _ascending_limits(parcel["weight_limits"], "parcel")
+        # A None bound leaves its side of the band open.
+        bands = sorted(
+            (
+                float("-inf") if low is None else low,
+                float("inf") if high is None else high,
+                band,
+            )
+            for band, (low, high) in enumerate(parcel["dimension_bands"])
+        )
+        self._band_starts = [low for low, _, _ in bands]
+        self._band_ends = [high for _, high, _ in bands]
+        self._band_ids = [band for _, _, band in bands]
+        self._parcel_costs = {
+            (weight_band, dimension_band): cost
+            for weight_band, dimension_band, cost in parcel["rates"]
+        }
+        self._parcel_default = parcel["default"]
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Loads a rate table from a JSON file.
+        """
+        with open(path, encoding="utf-8") as file:
+            return cls(json.load(file))
+
+    @property
+    def methods(self):
+        """
+        Returns the names of the methods of this table.
+        """
+        return list(self._methods)
+
+    def _method_rates(self, shipping_method):
+        """
+        Returns the weight limits and costs of a method name or
+        ShippingMethod member. Raises ValueError for unknown methods.
+        """
+        if isinstance(shipping_method, ShippingMethod):
+            shipping_method = shipping_method.value
+        try:
+            return self._methods[shipping_method]
+        except (KeyError, TypeError) as error:
+            raise ValueError("Invalid shipping method") from error
+
+    def weight_cost(self, total_weight, shipping_method):
+        """
+        Returns the cost of shipping total_weight with a method.
+        """
+        limits, costs = self._method_rates(shipping_method)
+        return costs[bisect_left(limits, total_weight)]
+
+    def items_cost(self, items, shipping_method):
+        """
+        Same as calculate_items_shipping_cost, using this table.
+        """
+        return self.weight_cost(sum(item["weight"] for item in items), shipping_method)
+
+    def weight_costs(self, total_weights, shipping_method):
+        """
+        Batch version of weight_cost for many weights shipped the same way.
+        """
+        limits, costs = self._method_rates(shipping_method)
+        return [costs[bisect_left(limits, weight)] for weight in total_weights]
+
+    def _dimension_band(self, size):
+        """
+        Returns the dimension band holding size, or None if it is in a gap.
+        """
+        position = bisect_right(self._band_starts, size) - 1
+        if position >= 0 and size <= self._band_ends[position]:
+            return self._band_ids[position]
+        return None
+
+    def parcel_cost(self, weight, length, width, height):
+        """
+        Same as calculate_shipping_cost, using this table.
+        """
+        band = self._dimension_band(length)
+        if band is None or not (
+            self._dimension_band(width) == band == self._dimension_band(height)
+        ):
+            return self._parcel_default
+        weight_band = bisect_left(self._parcel_limits, weight)
+        return self._parcel_costs.get((weight_band, band), self._parcel_default)
+
+    def parcel_costs(self, weights, lengths, widths, heights):
+        """
+        Batch version of parcel_cost over columns of parcel measurements.
+        """
+        return [
+            self.parcel_cost(*parcel)
+            for parcel in zip(weights, lengths, widths, heights)
+        ]
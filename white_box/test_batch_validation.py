@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+Batch validation unit testing examples.
+"""
+import unittest
+from concurrent.futures import Future
+from unittest.mock import patch
+
+from white_box.batch_validation import (
+    CHECKS,
+    failed_checks,
+    passed,
+    validate_columns,
+    validate_records,
+)
+
+
+class SerialExecutor:
+    """
+    Executor stand-in that runs each call when submitted and records the
+    largest number of results submitted but not yet collected.
+    """
+
+    def __init__(self):
+        """Serial executor init."""
+        self.pending = 0
+        self.peak = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def submit(self, function, *args):
+        """Runs a call and returns a future counting its collection."""
+        self.pending += 1
+        self.peak = max(self.peak, self.pending)
+        future = Future()
+        future.set_result(function(*args))
+        result = future.result
+
+        def collect():
+            self.pending -= 1
+            return result()
+
+        future.result = collect
+        return future
+
+
+class TestBatchValidation(unittest.TestCase):
+    """
+    Batch validation unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates a valid and an invalid record.
+        """
+        self.valid = {
+            "username": "jdoe123",
+            "password": "Secret#123",
+            "email": "user@example.com",
+            "card_number": "1234567890123",
+            "url": "https://example.com",
+            "year": 2024,
+            "month": 2,
+            "day": 29,
+        }
+        self.invalid = {
+            "username": "joe",
+            "password": "secret",
+            "email": "user@examplecom",
+            "card_number": "1234abcd56789",
+            "url": "ftp://example.com",
+            "year": 1899,
+            "month": 1,
+            "day": 1,
+        }
+        self.checks = [name for name, _, _ in CHECKS]
+
+    def test_validate_records(self):
+        """
+        Checks every check sets its bit for the valid record only.
+        """
+        results = validate_records([self.valid, self.invalid], self.checks)
+        self.assertEqual(list(results), [0b111111, 0])
+        self.assertTrue(passed(results[0], "date"))
+        self.assertEqual(failed_checks(results[1], ["email", "url"]), ["email", "url"])
+
+    def test_validate_selected_checks(self):
+        """
+        Checks only the selected checks run.
+        """
+        results = validate_records([{"email": "user@example.com"}], ["email"])
+        self.assertEqual(failed_checks(results[0], ["email", "url"]), ["url"])
+
+    def test_invalid_check(self):
+        """
+        Checks unknown check names raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            validate_records([self.valid], ["phone"])
+
+    def test_validate_columns(self):
+        """
+        Checks columns run the checks whose fields are all present.
+        """
+        results, checks = validate_columns(
+            {
+                "username": ["jdoe123", "joe"],
+                "password": ["Secret#123", "Secret#123"],
+            }
+        )
+        self.assertEqual(checks, ["password", "login"])
+        self.assertEqual(failed_checks(results[1], checks), ["login"])
+
+    def test_process_pool(self):
+        """
+        Checks the process pool mode returns the same results in order.
+        """
+        records = [self.valid, self.invalid] * 5
+        self.assertEqual(
+            validate_records(records, self.checks, workers=2, chunk_size=3),
+            validate_records(records, self.checks),
+        )
+
+    def test_process_pool_bounds_pending_chunks(self):
+        """
+        Checks at most two chunks per worker wait for their results.
+        """
+        executor = SerialExecutor()
+        with patch(
+            "white_box.batch_validation.ProcessPoolExecutor", return_value=executor
+        ):
+            results = validate_records(
+                [self.valid, self.invalid] * 20, self.checks, workers=2, chunk_size=2
+            )
+        self.assertEqual(
+            results, validate_records([self.valid, self.invalid] * 20, self.checks)
+        )
+        self.assertEqual(executor.peak, 4)
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+"""
+Book inventory unit testing examples.
+"""
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from white_box.book_inventory import BookInventory
+from white_box.book_persistence import PersistentBookStore
+from white_box.book_store import Book, BookColumns, BookStore
+
+
+class TestBookInventory(unittest.TestCase):
+    """
+    Book inventory unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates a store with a few books and its inventory.
+        """
+        self.book_store = BookStore()
+        self.book_store.add_books(
+            [
+                Book("1984", "George Orwell", 3.5, 2),
+                Book("Animal Farm", "George Orwell", 4.0, 12),
+                Book("1984", "George Orwell", 6.0, 5),
+            ]
+        )
+        self.inventory = BookInventory(self.book_store, low_stock_limit=10)
+
+    def test_sell(self):
+        """
+        Checks a sale lowers the stock and updates the title totals.
+        """
+        self.inventory.sell(0, 2)
+        self.assertEqual(self.book_store.books[0].quantity, 0)
+        self.assertEqual(self.inventory.title_stock("1984"), 5)
+        self.assertEqual(self.inventory.title_sold("1984"), 2)
+
+    def test_sell_insufficient_stock(self):
+        """
+        Checks a sale above the stock raises ValueError.
+        """
+        with self.assertRaises(ValueError):
+            self.inventory.sell(0, 3)
+        self.assertEqual(self.book_store.books[0].quantity, 2)
+
+    def test_non_positive_quantities(self):
+        """
+        Checks every movement rejects zero and negative quantities.
+        """
+        for movement in (
+            self.inventory.sell,
+            self.inventory.restock,
+            self.inventory.reserve,
+            self.inventory.release,
+        ):
+            for quantity in (0, -3):
+                with self.assertRaises(ValueError):
+                    movement(0, quantity)
+        self.assertEqual(self.book_store.books[0].quantity, 2)
+        self.assertEqual(self.inventory.title_sold("1984"), 0)
+
+    def test_fractional_quantities(self):
+        """
+        Checks fractional quantities and movements are rejected.
+        """
+        with self.assertRaises(ValueError):
+            self.inventory.restock(0, 0.5)
+        with self.assertRaises(ValueError):
+            self.inventory.apply_movements([(0, 1.5)])
+        self.assertEqual(self.inventory.title_stock("1984"), 7)
+
+    def test_failed_write_keeps_indexes(self):
+        """
+        Checks a quantity the store cannot hold leaves the indexes unchanged.
+        """
+        book_store = BookStore(BookColumns())
+        book_store.add_books([Book("1984", "George Orwell", 3.5, 3)])
+        inventory = BookInventory(book_store)
+        with self.assertRaises(OverflowError):
+            inventory.restock(0, 2**70)
+        self.assertEqual(book_store.books[0].quantity, 3)
+        self.assertEqual(inventory.title_stock("1984"), 3)
+        self.assertEqual(inventory.low_stock(), [0])
+
+    def test_reserve_and_sell_reserved(self):
+        """
+        Checks reserved units cannot be sold to others but can be collected.
+        """
+        self.inventory.reserve(0, 2)
+        self.assertEqual(self.inventory.available(0), 0)
+        with self.assertRaises(ValueError):
+            self.inventory.sell(0)
+        with self.assertRaises(ValueError):
+            self.inventory.reserve(0)
+        self.inventory.sell(0, 2, reserved=True)
+        self.assertEqual(self.book_store.books[0].quantity, 0)
+        with self.assertRaises(ValueError):
+            self.inventory.sell(0, 1, reserved=True)
+
+    def test_release(self):
+        """
+        Checks released units become available again.
+        """
+        self.inventory.reserve(2, 3)
+        self.inventory.release(2, 5)
+        self.assertEqual(self.inventory.available(2), 5)
+
+    def test_restock_and_low_stock(self):
+        """
+        Checks the low stock buckets follow the movements.
+        """
+        self.assertEqual(self.inventory.low_stock(), [0, 2])
+        self.assertEqual(self.inventory.low_stock(2), [0])
+        self.inventory.restock(0, 20)
+        self.inventory.sell(1, 4)
+        self.assertEqual(self.inventory.low_stock(), [2, 1])
+        with self.assertRaises(ValueError):
+            self.inventory.low_stock(11)
+
+    def test_apply_movements_is_atomic(self):
+        """
+        Checks a batch with one invalid movement changes nothing.
+        """
+        with self.assertRaises(ValueError):
+            self.inventory.apply_movements([(1, -2), (0, -3)])
+        self.assertEqual(self.book_store.books[1].quantity, 12)
+        self.inventory.apply_movements([(1, -2), (0, -3), (0, 4), (2, 0)])
+        self.assertEqual(self.book_store.books[0].quantity, 3)
+        self.assertEqual(self.book_store.books[1].quantity, 10)
+        self.assertEqual(self.inventory.title_stock("1984"), 8)
+        self.assertEqual(self.inventory.title_sold("1984"), 3)
+        self.assertEqual(self.inventory.title_sold("Animal Farm"), 2)
+
+    def test_tracks_books_added_later(self):
+        """
+        Checks books added after the inventory was created are indexed.
+        """
+        self.book_store.add_books([Book("Dune", "Frank Herbert", 9.0, 1)])
+        self.assertEqual(self.inventory.low_stock(1), [3])
+        self.assertEqual(self.inventory.title_stock("dune"), 1)
+
+    def test_persistent_store_logs_movements(self):
+        """
+        Checks the movements on a persistent store survive a restart.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            with PersistentBookStore(directory) as book_store:
+                with patch("builtins.print"):
+                    book_store.add_book(Book("1984", "George Orwell", 3.5, 2))
+                BookInventory(book_store).sell(0)
+            with PersistentBookStore(directory) as book_store:
+                self.assertEqual(book_store.books[0].quantity, 1)
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+Persistent book store unit testing examples.
+"""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from white_box.book_persistence import LOG_NAME, PersistentBookStore, read_log
+from white_box.book_store import Book
+
+
+class TestPersistentBookStore(unittest.TestCase):
+    """
+    Persistent book store unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates a temporary data directory.
+        """
+        self.temporary_directory = (
+            tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        )
+        self.directory = self.temporary_directory.name
+        self.books = [
+            Book("1984", "George Orwell", 3.5, 2),
+            Book("Animal Farm", "George Orwell", 4.0, 1),
+        ]
+
+    def tearDown(self):
+        """
+        Removes the temporary data directory.
+        """
+        self.temporary_directory.cleanup()
+
+    def titles(self, book_store):
+        """
+        Returns the titles and quantities stored in a book store.
+        """
+        return [(book.title, book.quantity) for book in book_store.books]
+
+    def test_recovers_from_log(self):
+        """
+        Checks the books and quantity changes are replayed from the log.
+        """
+        with PersistentBookStore(self.directory) as book_store:
+            with patch("builtins.print"):
+                book_store.add_book(self.books[0])
+            book_store.add_books(self.books[1:])
+            book_store.set_quantity(0, 7)
+        with PersistentBookStore(self.directory) as book_store:
+            self.assertEqual(self.titles(book_store), [("1984", 7), ("Animal Farm", 1)])
+            self.assertEqual(len(book_store.find_by_author("George Orwell")), 2)
+
+    def test_recovers_from_snapshot_and_log(self):
+        """
+        Checks compaction empties the log and recovery reads both files.
+        """
+        with PersistentBookStore(self.directory) as book_store:
+            book_store.add_books(self.books)
+            book_store.compact()
+            self.assertEqual(list(read_log(book_store.log_path)), [])
+            book_store.add_books([Book("Dune", "Frank Herbert", 9.0, 4)])
+            book_store.set_quantity(1, 0)
+        with PersistentBookStore(self.directory) as book_store:
+            self.assertEqual(
+                self.titles(book_store),
+                [("1984", 2), ("Animal Farm", 0), ("Dune", 4)],
+            )
+
+    def test_group_commit(self):
+        """
+        Checks the log is synced once per sync_every records.
+        """
+        with PersistentBookStore(self.directory, sync_every=2) as book_store:
+            with patch("white_box.book_persistence.os.fsync") as mock_fsync:
+                book_store.add_books(self.books * 2)
+            self.assertEqual(mock_fsync.call_count, 2)
+
+    def test_compact_every(self):
+        """
+        Checks the log is compacted once it holds compact_every records,
+        counting the records replayed on recovery.
+        """
+        with PersistentBookStore(self.directory, compact_every=4) as book_store:
+            book_store.add_books(self.books)
+            book_store.set_quantity(0, 5)
+            self.assertEqual(book_store.generation, 0)
+        with PersistentBookStore(self.directory, compact_every=4) as book_store:
+            book_store.set_quantity(1, 3)
+            self.assertEqual(book_store.generation, 1)
+            self.assertEqual(list(read_log(book_store.log_path)), [])
+            book_store.add_books([Book("Dune", "Frank Herbert", 9.0, 4)])
+        with PersistentBookStore(self.directory) as book_store:
+            self.assertEqual(
+                self.titles(book_store),
+                [("1984", 5), ("Animal Farm", 3), ("Dune", 4)],
+            )
+
+    def test_ignores_torn_last_record(self):
+        """
+        Checks a partially written last record is ignored on recovery.
+        """
+        with PersistentBookStore(self.directory) as book_store:
+            book_store.add_books(self.books)
+        with open(os.path.join(self.directory, LOG_NAME), "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "title": "Du')
+        with PersistentBookStore(self.directory) as book_store:
+            self.assertEqual(len(book_store.books), 2)
+            book_store.add_books([Book("Dune", "Frank Herbert", 9.0, 4)])
+        with PersistentBookStore(self.directory) as book_store:
+            self.assertEqual(
+                self.titles(book_store),
+                [("1984", 2), ("Animal Farm", 1), ("Dune", 4)],
+            )
+
+    def test_crash_during_compaction(self):
+        """
+        Checks a log already folded into the snapshot is not replayed again.
+        """
+        book_store = PersistentBookStore(self.directory)
+        book_store.add_books(self.books)
+        with patch.object(PersistentBookStore, "_start_log", side_effect=OSError):
+            with self.assertRaises(OSError):
+                book_store.compact()
+        with PersistentBookStore(self.directory) as book_store:
+            self.assertEqual(self.titles(book_store), [("1984", 2), ("Animal Farm", 1)])
+            self.assertEqual(list(read_log(book_store.log_path)), [])
+            book_store.set_quantity(0, 5)
+        with PersistentBookStore(self.directory) as book_store:
+            self.assertEqual(self.titles(book_store), [("1984", 5), ("Animal Farm", 1)])
+
+    def test_invalid_record(self):
+        """
+        Checks an unknown record type is rejected.
+        """
+        with open(os.path.join(self.directory, LOG_NAME), "w", encoding="utf-8") as f:
+            f.write('{"op": "delete"}\n')
+        with self.assertRaises(ValueError):
+            PersistentBookStore(self.directory)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+asyncio book server unit testing examples.
+"""
+import asyncio
+import json
+import threading
+import unittest
+
+from white_box.book_server import (
+    LIST_LIMIT_MAX,
+    AsyncBookStore,
+    BookServer,
+    measure_latency,
+    percentile,
+)
+from white_box.book_store import Book
+
+
+class TestAsyncBookStore(unittest.IsolatedAsyncioTestCase):
+    """
+    Async book store unittest class.
+    """
+
+    async def test_add_search_and_list(self):
+        """
+        Checks the coroutines add, search and page through the books.
+        """
+        books = AsyncBookStore()
+        await books.add_book(Book("1984", "George Orwell", 3.5, 2))
+        await books.add_book(Book("Animal Farm", "George Orwell", 4.0, 1))
+        found_books = await books.search_book("animal farm")
+        self.assertEqual([book.title for book in found_books], ["Animal Farm"])
+        page = await books.list_books(offset=1, limit=5)
+        self.assertEqual([book.title for book in page], ["Animal Farm"])
+
+    async def test_search_waits_off_the_event_loop(self):
+        """
+        Checks a search waiting for the store lock leaves the loop running.
+        """
+        books = AsyncBookStore()
+        await books.add_book(Book("1984", "George Orwell", 3.5, 2))
+        held = threading.Event()
+        release = threading.Event()
+
+        def write():
+            with books.store.lock.write():
+                held.set()
+                release.wait(1)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        held.wait()
+        search = asyncio.create_task(books.search_book("1984"))
+        await asyncio.sleep(0.05)
+        self.assertFalse(search.done())
+        release.set()
+        self.assertEqual(len(await search), 1)
+        writer.join()
+
+
+class TestBookServer(unittest.IsolatedAsyncioTestCase):
+    """
+    Book server unittest class.
+    """
+
+    async def asyncSetUp(self):
+        """
+        Starts a server on a free local port.
+        """
+        self.server = await BookServer().start(port=0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        """
+        Stops the server.
+        """
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def send(self, *requests):
+        """
+        Sends raw request lines on one connection and returns the responses.
+        """
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        responses = []
+        for request in requests:
+            writer.write(request + b"\n")
+            await writer.drain()
+            responses.append(json.loads(await reader.readline()))
+        writer.close()
+        await writer.wait_closed()
+        return responses
+
+    async def test_add_then_search(self):
+        """
+        Checks a book added through the server can be searched.
+        """
+        book = {"title": "1984", "author": "Orwell", "price": 3.5, "quantity": 2}
+        add = {"op": "add", **book}
+        responses = await self.send(
+            json.dumps(add).encode(),
+            b'{"op": "search", "title": "1984"}',
+            b'{"op": "list", "offset": 1}',
+        )
+        self.assertEqual(
+            responses, [{"books": [book]}, {"books": [book]}, {"books": []}]
+        )
+
+    async def test_invalid_requests(self):
+        """
+        Checks malformed and unknown requests get an error response.
+        """
+        responses = await self.send(b"not json", b'{"op": "delete"}', b"[]")
+        self.assertTrue(all("error" in response for response in responses))
+        self.assertEqual(responses[1], {"error": "Invalid operation 'delete'"})
+
+    async def test_list_limit_is_capped(self):
+        """
+        Checks a list request never returns more than LIST_LIMIT_MAX books.
+        """
+        books = AsyncBookStore()
+        books.store.add_books(
+            Book(f"Title {number}", "Author", 1.0, 1)
+            for number in range(LIST_LIMIT_MAX + 5)
+        )
+        server = BookServer(books)
+        response = await server.handle_request({"op": "list", "limit": 10**9})
+        self.assertEqual(len(response["books"]), LIST_LIMIT_MAX)
+        response = await server.handle_request({"op": "list", "offset": 2, "limit": 3})
+        self.assertEqual(
+            [book["title"] for book in response["books"]],
+            ["Title 2", "Title 3", "Title 4"],
+        )
+
+    async def test_measure_latency(self):
+        """
+        Checks the load generator reports ordered percentiles.
+        """
+        latencies = await measure_latency(
+            "127.0.0.1", self.port, clients=20, requests_per_client=5
+        )
+        self.assertLessEqual(latencies["p50"], latencies["p99"])
+
+    def test_percentile(self):
+        """
+        Checks the percentile helper.
+        """
+        values = list(range(100))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile(values, 1.0), 99)
@@ -3,10 +3,23 @@
 """
 Book store unit testing examples.
 """
+import io
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
-from white_box.book_store import Book, BookStore
+from white_box.book_store import (
+    Book,
+    BookColumns,
+    BookStore,
+    dump_snapshot,
+    edit_distance,
+    main,
+    read_books,
+    render_books,
+    write_books,
+)
 
 
 class TestBook(unittest.TestCase):
@@ -173,3 +186,447 @@ class TestBookStore(unittest.TestCase):
             ]
         )
         mock_print.assert_any_call(f"No book found with title '{title_to_search}'.")
+
+
+class TestBookStoreIndex(unittest.TestCase):
+    """
+    Book store index unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates a book store with a few books.
+        """
+        self.book_store = BookStore()
+        self.orwell_1984 = Book("1984", "George Orwell", 3.5, 2)
+        self.orwell_farm = Book("Animal Farm", "George Orwell", 4.0, 1)
+        self.bradbury = Book("Fahrenheit 451", "Ray Bradbury", 5.0, 3)
+        with patch("builtins.print"):
+            for book in (self.orwell_1984, self.orwell_farm, self.bradbury):
+                self.book_store.add_book(book)
+
+    def test_find_by_title_ignores_case(self):
+        """
+        Checks the title lookup ignores case.
+        """
+        self.assertEqual(
+            self.book_store.find_by_title("ANIMAL FARM"), [self.orwell_farm]
+        )
+
+    def test_find_by_title_not_found(self):
+        """
+        Checks the title lookup returns an empty list for unknown titles.
+        """
+        self.assertEqual(self.book_store.find_by_title("Dune"), [])
+
+    def test_find_by_author(self):
+        """
+        Checks the author lookup returns every book of the author.
+        """
+        self.assertEqual(
+            self.book_store.find_by_author("george orwell"),
+            [self.orwell_1984, self.orwell_farm],
+        )
+
+    def test_find_by_title_keeps_duplicates(self):
+        """
+        Checks books sharing a title are all returned in insertion order.
+        """
+        copy = Book("1984", "George Orwell", 6.0, 1)
+        with patch("builtins.print"):
+            self.book_store.add_book(copy)
+        self.assertEqual(
+            self.book_store.find_by_title("1984"), [self.orwell_1984, copy]
+        )
+
+
+class TestBookStoreSearch(unittest.TestCase):
+    """
+    Book store search modes unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates a book store with a few books.
+        """
+        self.book_store = BookStore()
+        self.dune = Book("Dune", "Frank Herbert", 9.0, 4)
+        self.dune_messiah = Book("Dune Messiah", "Frank Herbert", 8.0, 2)
+        self.orwell_1984 = Book("1984", "George Orwell", 3.5, 2)
+        self.orwell_farm = Book("Animal Farm", "George Orwell", 4.0, 1)
+        with patch("builtins.print"):
+            for book in (
+                self.dune,
+                self.dune_messiah,
+                self.orwell_1984,
+                self.orwell_farm,
+            ):
+                self.book_store.add_book(book)
+
+    def test_search_prefix(self):
+        """
+        Checks the prefix search returns the titles sharing the prefix.
+        """
+        self.assertEqual(
+            self.book_store.search_prefix("du"), [self.dune, self.dune_messiah]
+        )
+
+    def test_search_prefix_limit(self):
+        """
+        Checks the prefix search honours the limit.
+        """
+        self.assertEqual(self.book_store.search_prefix("DUNE", limit=1), [self.dune])
+
+    def test_search_prefix_not_found(self):
+        """
+        Checks the prefix search returns an empty list when nothing matches.
+        """
+        self.assertEqual(self.book_store.search_prefix("zz"), [])
+
+    def test_search_text_matches_title_and_author(self):
+        """
+        Checks the full-text search matches words in both title and author.
+        """
+        self.assertEqual(self.book_store.search_text("farm orwell"), [self.orwell_farm])
+
+    def test_search_text_requires_every_word(self):
+        """
+        Checks the full-text search returns nothing if a word is missing.
+        """
+        self.assertEqual(self.book_store.search_text("dune orwell"), [])
+        self.assertEqual(self.book_store.search_text("  "), [])
+
+    def test_search_fuzzy(self):
+        """
+        Checks the fuzzy search tolerates typos and orders by distance.
+        """
+        self.assertEqual(self.book_store.search_fuzzy("Dnue"), [self.dune])
+        self.assertEqual(
+            self.book_store.search_fuzzy("Animal Frm", max_distance=1),
+            [self.orwell_farm],
+        )
+
+    def test_search_fuzzy_after_add(self):
+        """
+        Checks books added after the first fuzzy search are found.
+        """
+        self.assertEqual(self.book_store.search_fuzzy("It"), [])
+        it = Book("It", "Stephen King", 7.0, 1)
+        with patch("builtins.print"):
+            self.book_store.add_book(it)
+        self.assertEqual(self.book_store.search_fuzzy("Id", max_distance=1), [it])
+        self.assertEqual(
+            self.book_store.search_fuzzy("Dune Mesiah", max_distance=3),
+            [self.dune_messiah],
+        )
+
+    @patch("builtins.print")
+    @patch("builtins.input")
+    def test_main_prefix_search(self, mock_input, mock_print):
+        """
+        Checks menu option 5 runs a prefix search and option 4 still exits.
+        """
+        mock_input.side_effect = [
+            "3",
+            "Dune",
+            "Frank Herbert",
+            "9.0",
+            "4",
+            "5",
+            "du",
+            "5",
+            "zz",
+            "4",
+        ]
+        main()
+        mock_print.assert_any_call("Title: Dune")
+        mock_print.assert_any_call("No book found starting with 'zz'.")
+        mock_print.assert_called_with("Exiting...")
+
+    def test_search_fuzzy_empty_store(self):
+        """
+        Checks the fuzzy search on an empty store.
+        """
+        self.assertEqual(BookStore().search_fuzzy("Dune"), [])
+
+    def test_edit_distance(self):
+        """
+        Checks the bounded edit distance.
+        """
+        self.assertEqual(edit_distance("kitten", "sitting", 5), 3)
+        self.assertEqual(edit_distance("kitten", "sitting", 1), 2)
+        self.assertEqual(edit_distance("a", "abcd", 1), 2)
+
+
+class TestBookColumns(unittest.TestCase):
+    """
+    Columnar book storage unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates a book store backed by columnar storage.
+        """
+        self.book_store = BookStore(BookColumns())
+        with patch("builtins.print"):
+            self.book_store.add_book(Book("1984", "George Orwell", 3.5, 2))
+            self.book_store.add_book(Book("Animal Farm", "George Orwell", 4.0, 1))
+
+    def test_book_has_no_dict(self):
+        """
+        Checks books use slots instead of a per-instance dict.
+        """
+        self.assertFalse(hasattr(Book("1984", "George Orwell", 3.5, 2), "__dict__"))
+
+    def test_views_expose_book_fields(self):
+        """
+        Checks the views read the stored columns.
+        """
+        book = self.book_store.books[1]
+        self.assertEqual(len(self.book_store.books), 2)
+        self.assertEqual(book.title, "Animal Farm")
+        self.assertEqual(book.author, "George Orwell")
+        self.assertEqual(book.price, 4.0)
+        self.assertEqual(book.quantity, 1)
+
+    def test_authors_are_interned(self):
+        """
+        Checks repeated authors share one string object.
+        """
+        authors = self.book_store.books.authors
+        self.assertIs(authors[0], authors[1])
+
+    def test_view_updates_columns(self):
+        """
+        Checks writing through a view updates the packed arrays.
+        """
+        book = self.book_store.books[-1]
+        book.quantity = 7
+        book.price = 5.25
+        self.assertEqual(self.book_store.books.quantities[1], 7)
+        self.assertEqual(self.book_store.books.prices[1], 5.25)
+
+    def test_index_out_of_range(self):
+        """
+        Checks an out of range row raises IndexError.
+        """
+        with self.assertRaises(IndexError):
+            self.book_store.books[2]  # pylint: disable=pointless-statement
+
+    def test_search_over_columns(self):
+        """
+        Checks the search indexes work over columnar storage.
+        """
+        self.assertEqual(
+            [book.title for book in self.book_store.find_by_author("george orwell")],
+            ["1984", "Animal Farm"],
+        )
+        self.assertEqual(
+            [
+                book.title
+                for book in BookStore(self.book_store.books).search_prefix("a")
+            ],
+            ["Animal Farm"],
+        )
+
+    @patch("builtins.print")
+    def test_display_books(self, mock_print):
+        """
+        Checks views are displayed like books.
+        """
+        self.book_store.display_books()
+        mock_print.assert_any_call("Title: Animal Farm")
+        mock_print.assert_called_with("Quantity: 1")
+
+
+class TestRenderBooks(unittest.TestCase):
+    """
+    Book rendering pipeline unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates a few books.
+        """
+        self.books = [
+            Book("1984", "George Orwell", 3.5, 2),
+            Book("Animal Farm", "George Orwell", 4.0, 1),
+            Book("Dune, Part 1", "Frank Herbert", 9.0, 4),
+        ]
+
+    def test_render_text_matches_display(self):
+        """
+        Checks the text format uses the Book.display layout.
+        """
+        self.assertEqual(
+            "".join(render_books(self.books[:1])),
+            "Title: 1984\nAuthor: George Orwell\nPrice: $3.5\nQuantity: 2\n",
+        )
+
+    def test_render_batches(self):
+        """
+        Checks the books are grouped into batch_size chunks.
+        """
+        chunks = list(render_books(self.books, batch_size=2))
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(chunks[1].count("Title: "), 1)
+
+    def test_render_csv_with_pagination(self):
+        """
+        Checks the CSV format, its header and offset/limit pagination.
+        """
+        self.assertEqual(
+            "".join(render_books(self.books, "csv", offset=1, limit=5)),
+            "title,author,price,quantity\n"
+            "Animal Farm,George Orwell,4.0,1\n"
+            '"Dune, Part 1",Frank Herbert,9.0,4\n',
+        )
+
+    def test_render_jsonl(self):
+        """
+        Checks the JSON Lines format.
+        """
+        self.assertEqual(
+            "".join(render_books(self.books, "jsonl", limit=1)),
+            '{"title": "1984", "author": "George Orwell", "price": 3.5, '
+            '"quantity": 2}\n',
+        )
+
+    def test_render_invalid_format(self):
+        """
+        Checks an unknown format raises ValueError.
+        """
+        with self.assertRaises(ValueError):
+            list(render_books(self.books, "xml"))
+
+    def test_write_books_batches_writes(self):
+        """
+        Checks write_books issues one write per batch.
+        """
+        sink = io.StringIO()
+        with patch.object(sink, "write", wraps=sink.write) as mock_write:
+            write_books(self.books, sink, batch_size=2)
+        self.assertEqual(mock_write.call_count, 2)
+        self.assertEqual(sink.getvalue().count("Title: "), 3)
+
+    def test_export_books_defaults_to_stdout(self):
+        """
+        Checks the store exports to stdout by default.
+        """
+        book_store = BookStore(BookColumns())
+        with patch("builtins.print"):
+            for book in self.books:
+                book_store.add_book(book)
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            book_store.export_books(fmt="csv", offset=2)
+        self.assertEqual(
+            mock_stdout.getvalue(),
+            'title,author,price,quantity\n"Dune, Part 1",Frank Herbert,9.0,4\n',
+        )
+
+
+class TestBulkImportExport(unittest.TestCase):
+    """
+    Bulk import and export unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates a few books.
+        """
+        self.books = [
+            Book("1984", "George Orwell", 3.5, 2),
+            Book("Animal Farm", "George Orwell", 4.0, 1),
+            Book("Cien años de soledad", "Gabriel García Márquez", 9.0, 4),
+        ]
+
+    def assert_same_books(self, books):
+        """
+        Checks the books have the same fields as the fixture books.
+        """
+        self.assertEqual(
+            [(b.title, b.author, b.price, b.quantity) for b in books],
+            [(b.title, b.author, b.price, b.quantity) for b in self.books],
+        )
+
+    @patch("builtins.print")
+    def test_add_books_does_not_print(self, mock_print):
+        """
+        Checks the bulk add indexes the books silently.
+        """
+        book_store = BookStore()
+        self.assertEqual(book_store.add_books(reversed(self.books)), 3)
+        mock_print.assert_not_called()
+        self.assertEqual(book_store.search_prefix("")[0].title, "1984")
+
+    def test_csv_round_trip(self):
+        """
+        Checks books exported as CSV are imported back.
+        """
+        file = io.StringIO("".join(render_books(self.books, "csv")))
+        book_store = BookStore()
+        self.assertEqual(book_store.import_books(file), 3)
+        self.assert_same_books(book_store.books)
+
+    def test_jsonl_round_trip(self):
+        """
+        Checks books exported as JSON Lines are imported back.
+        """
+        file = io.StringIO("".join(render_books(self.books, "jsonl")) + "\n")
+        self.assert_same_books(read_books(file, "jsonl"))
+
+    def test_read_books_invalid_format(self):
+        """
+        Checks an unknown format raises ValueError.
+        """
+        with self.assertRaises(ValueError):
+            list(read_books(io.StringIO(""), "xml"))
+
+    def test_snapshot_round_trip(self):
+        """
+        Checks a binary snapshot loads back into columnar storage.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "books.snap")
+            dump_snapshot(self.books, path)
+            columns = BookColumns.from_snapshot(path)
+        self.assertIsInstance(columns.prices, memoryview)
+        self.assert_same_books(columns)
+        book_store = BookStore(columns)
+        self.assertEqual(len(book_store.find_by_author("george orwell")), 2)
+        with patch("builtins.print"):
+            book_store.add_book(Book("Dune", "Frank Herbert", 9.5, 1))
+        self.assertEqual(book_store.books[3].price, 9.5)
+        self.assertEqual(book_store.books[0].quantity, 2)
+        self.assertEqual(list(columns.titles)[-2:], ["Cien años de soledad", "Dune"])
+        self.assertEqual(columns.authors[-2], "Gabriel García Márquez")
+        self.assertEqual(
+            [book.title for book in book_store.search_text("años márquez")],
+            ["Cien años de soledad"],
+        )
+        with self.assertRaises(IndexError):
+            columns.titles[4]  # pylint: disable=pointless-statement
+
+    def test_title_index_kept_in_sync(self):
+        """
+        Checks loading and adding books index them, so lookups read no rows.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "books.snap")
+            dump_snapshot(self.books, path)
+            book_store = BookStore(BookColumns.from_snapshot(path))
+        book_store.add_books([Book("Dune", "Frank Herbert", 9.5, 1)])
+        with patch.object(BookColumns, "fields", return_value=iter(())):
+            self.assertEqual(len(book_store.find_by_author("george orwell")), 2)
+            self.assertEqual(len(book_store.find_by_title("dune")), 1)
+
+    def test_snapshot_invalid_file(self):
+        """
+        Checks a file without the snapshot header is rejected.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "books.snap")
+            with open(path, "wb") as file:
+                file.write(b"\0" * 64)
+            with self.assertRaises(ValueError):
+                BookColumns.from_snapshot(path)
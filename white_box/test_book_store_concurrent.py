@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""
+Thread-safe book store unit testing examples.
+"""
+import threading
+import unittest
+from unittest.mock import patch
+
+from white_box.book_store import Book
+from white_box.book_store_concurrent import ConcurrentBookStore, ReadWriteLock
+
+
+class TestReadWriteLock(unittest.TestCase):
+    """
+    Read write lock unittest class.
+    """
+
+    def test_readers_share_the_lock(self):
+        """
+        Checks a second reader gets in while the first one holds the lock.
+        """
+        lock = ReadWriteLock()
+        entered = threading.Event()
+
+        def read():
+            with lock.read():
+                entered.set()
+
+        with lock.read():
+            thread = threading.Thread(target=read)
+            thread.start()
+            self.assertTrue(entered.wait(timeout=5))
+        thread.join()
+
+    def test_writer_waits_for_readers(self):
+        """
+        Checks a writer only gets in after the readers leave.
+        """
+        lock = ReadWriteLock()
+        events = []
+
+        def write():
+            with lock.write():
+                events.append("write")
+
+        with lock.read():
+            thread = threading.Thread(target=write)
+            thread.start()
+            thread.join(timeout=0.1)
+            events.append("read")
+        thread.join()
+        self.assertEqual(events, ["read", "write"])
+
+
+class TestConcurrentBookStore(unittest.TestCase):
+    """
+    Thread-safe book store unittest class.
+    """
+
+    def test_add_and_search(self):
+        """
+        Checks the locked methods keep the BookStore behavior.
+        """
+        book_store = ConcurrentBookStore()
+        with patch("builtins.print") as mock_print:
+            book_store.add_book(Book("1984", "George Orwell", 3.5, 2))
+        mock_print.assert_called_once_with("Book '1984' added to the store.")
+        book_store.add_books([Book("Animal Farm", "George Orwell", 4.0, 1)])
+        self.assertEqual(len(book_store.find_by_author("george orwell")), 2)
+        self.assertEqual(len(book_store.search_prefix("anim")), 1)
+        self.assertEqual(len(book_store.search_text("farm")), 1)
+        self.assertEqual(len(book_store.search_fuzzy("1985", 1)), 1)
+        self.assertEqual(len(book_store.find_by_title("1984")), 1)
+
+    def test_searches_during_writes(self):
+        """
+        Checks searches from several threads while another thread adds books.
+        """
+        book_store = ConcurrentBookStore()
+        errors = []
+
+        def write():
+            for number in range(200):
+                book_store.add_books([Book(f"Book {number}", "Author", 1.0, 1)])
+
+        def search():
+            try:
+                for _ in range(200):
+                    found = book_store.search_prefix("book")
+                    self.assertEqual(len(found), len(set(map(id, found))))
+                    book_store.find_by_author("author")
+            except AssertionError as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=write)]
+        threads += [threading.Thread(target=search) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(book_store.find_by_author("author")), 200)
+
+    def test_searches_leave_the_gc_alone(self):
+        """
+        Checks searches over up-to-date indexes never pause the garbage
+        collector, whose state is shared by every reader thread.
+        """
+        book_store = ConcurrentBookStore()
+        book_store.add_books([Book("1984", "George Orwell", 3.5, 2)])
+        book_store.search_text("orwell")
+        book_store.search_fuzzy("1985")
+        with patch("white_box.book_store.gc.disable") as mock_disable:
+            book_store.find_by_title("1984")
+            book_store.find_by_author("george orwell")
+            book_store.search_prefix("19")
+            book_store.search_text("orwell")
+            book_store.search_fuzzy("1985")
+        mock_disable.assert_not_called()
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""
+SQLite book store unit testing examples.
+"""
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest.mock import call, patch
+
+from white_box.book_store import Book
+from white_box.book_store_sqlite import SQLiteBookStore
+
+
+class TestSQLiteBookStore(unittest.TestCase):
+    """
+    SQLite book store unittest class.
+    """
+
+    def setUp(self):
+        """
+        Opens a book store on a temporary database.
+        """
+        self.temporary_directory = (
+            tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        )
+        self.path = os.path.join(self.temporary_directory.name, "books.db")
+        self.book_store = SQLiteBookStore(self.path, readers=2)
+        self.book = Book("1984", "George Orwell", 3.5, 2)
+
+    def tearDown(self):
+        """
+        Closes the book store and removes the database.
+        """
+        self.book_store.close()
+        self.temporary_directory.cleanup()
+
+    @patch("builtins.print")
+    def test_add_book(self, mock_print):
+        """
+        Checks a book is stored and announced.
+        """
+        self.book_store.add_book(self.book)
+        mock_print.assert_called_once_with("Book '1984' added to the store.")
+        self.assertEqual(len(self.book_store), 1)
+
+    def test_add_books_and_find(self):
+        """
+        Checks the bulk insert and the indexed lookups.
+        """
+        count = self.book_store.add_books(
+            [self.book, Book("Animal Farm", "George Orwell", 4.0, 1)]
+        )
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            [book.title for book in self.book_store.find_by_author("GEORGE ORWELL")],
+            ["1984", "Animal Farm"],
+        )
+        self.assertEqual(
+            [book.price for book in self.book_store.find_by_title("animal farm")],
+            [4.0],
+        )
+
+    def test_uses_wal_mode(self):
+        """
+        Checks the database uses write-ahead logging.
+        """
+        connection = sqlite3.connect(self.path)
+        mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+        connection.close()
+        self.assertEqual(mode, "wal")
+
+    def test_reopen_keeps_books(self):
+        """
+        Checks the books survive reopening the database.
+        """
+        self.book_store.add_books([self.book])
+        with SQLiteBookStore(self.path) as book_store:
+            self.assertEqual([book.title for book in book_store.books], ["1984"])
+
+    @patch("builtins.print")
+    def test_display_books_empty(self, mock_print):
+        """
+        Checks the message for an empty store.
+        """
+        self.book_store.display_books()
+        mock_print.assert_called_once_with("No books in the store.")
+
+    @patch("builtins.print")
+    def test_display_books(self, mock_print):
+        """
+        Checks the books are displayed like the in-memory store does.
+        """
+        self.book_store.add_books([self.book])
+        self.book_store.display_books()
+        mock_print.assert_has_calls(
+            [
+                call("Books available in the store:"),
+                call("Title: 1984"),
+                call("Author: George Orwell"),
+                call("Price: $3.5"),
+                call("Quantity: 2"),
+            ]
+        )
+
+    @patch("builtins.print")
+    def test_search_book(self, mock_print):
+        """
+        Checks the search messages.
+        """
+        self.book_store.add_books([self.book])
+        self.book_store.search_book("Dune")
+        mock_print.assert_called_with("No book found with title 'Dune'.")
+        self.book_store.search_book("1984")
+        mock_print.assert_any_call("Found 1 book(s) with title '1984':")
+
+    def test_concurrent_readers(self):
+        """
+        Checks readers on several threads see the committed books.
+        """
+        self.book_store.add_books([self.book] * 10)
+        results = []
+
+        def read():
+            results.append(len(self.book_store.find_by_title("1984")))
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [10] * 8)
+
+    def test_rejects_memory_database(self):
+        """
+        Checks databases private to one connection are rejected.
+        """
+        for path in (":memory:", ""):
+            with self.assertRaises(ValueError):
+                SQLiteBookStore(path)
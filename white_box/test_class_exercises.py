@@ -4,6 +4,7 @@
 White-box unit testing examples.
 """
 import unittest
+from decimal import Decimal
 from unittest.mock import patch
 
 from white_box.class_exercises import (
@@ -30,6 +31,7 @@ from white_box.class_exercises import (
     validate_password,
     verify_age,
 )
+from white_box.validators import is_valid_date
 
 
 class TestWhiteBox(unittest.TestCase):
@@ -278,6 +280,17 @@ class TestCalculateOrderTotal(unittest.TestCase):
         items = [{"quantity": 11, "price": 20}]
         self.assertEqual(calculate_order_total(items), 198)
 
+    def test_calculate_order_total_keeps_price_type(self):
+        """
+        Checks undiscounted totals keep the type of the prices.
+        """
+
+        total = calculate_order_total([{"quantity": 2, "price": 10}])
+        self.assertEqual(total, 20)
+        self.assertIsInstance(total, int)
+        items = [{"quantity": 3, "price": Decimal("0.10")}]
+        self.assertEqual(calculate_order_total(items), Decimal("0.30"))
+
 
 class TestCalculateItemsShippingCost(unittest.TestCase):
     """
@@ -494,6 +507,15 @@ class TestCategorizeProduct(unittest.TestCase):
         self.assertEqual(categorize_product(9), "Category D")
         self.assertEqual(categorize_product(201), "Category D")
 
+    def test_categorize_product_fractional_prices(self):
+        """
+        Checks fractional prices between the whole-number bands.
+        """
+        self.assertEqual(categorize_product(9.99), "Category D")
+        self.assertEqual(categorize_product(50.5), "Category A")
+        self.assertEqual(categorize_product(100.99), "Category B")
+        self.assertEqual(categorize_product(200.5), "Category C")
+
 
 class TestValidateEmail(unittest.TestCase):
     """
@@ -882,6 +904,111 @@ class TestShoppingCart(unittest.TestCase):
         self.assertEqual(cart.items[0]["product"], product)
         self.assertEqual(cart.items[0]["quantity"], 1)
 
+    def test_remove_product_not_in_cart(self):
+        """
+        Checks removing a product that is not in the cart changes nothing.
+        """
+
+        cart = ShoppingCart()
+        cart.add_product(Product("Laptop", 999.99), 1)
+        cart.remove_product(Product("Mouse", 49.99))
+        self.assertEqual(len(cart.items), 1)
+
+    def test_items_keep_insertion_order(self):
+        """
+        Checks the cart lines keep the order the products were added in.
+        """
+
+        cart = ShoppingCart()
+        products = [Product(f"Product {number}", number) for number in range(5)]
+        for product in products:
+            cart.add_product(product, 2)
+        cart.remove_product(products[1], 2)
+        cart.add_product(products[1])
+        cart.add_product(products[0])
+        expected = [(products[0], 3), (products[2], 2), (products[3], 2)]
+        expected += [(products[4], 2), (products[1], 1)]
+        self.assertEqual(
+            [(item["product"], item["quantity"]) for item in cart.items], expected
+        )
+
+    def test_items_are_copies(self):
+        """
+        Checks changing the returned lines does not change the cart.
+        """
+
+        cart = ShoppingCart()
+        product = Product("Laptop", 999.99)
+        cart.add_product(product, 1)
+        cart.items[0]["quantity"] = 10
+        self.assertEqual(cart.items[0]["quantity"], 1)
+        self.assertEqual(cart.subtotal, 999.99)
+
+    def test_subtotal_follows_changes(self):
+        """
+        Checks the running subtotal and line count after adds and removals.
+        """
+
+        cart = ShoppingCart(check_consistency=True)
+        laptop = Product("Laptop", 999.99)
+        mouse = Product("Mouse", 49.99)
+        cart.add_product(laptop, 1)
+        cart.add_product(mouse, 3)
+        cart.remove_product(mouse, 1)
+        self.assertAlmostEqual(cart.subtotal, 999.99 + 2 * 49.99)
+        self.assertEqual(cart.line_count, 2)
+        cart.remove_product(mouse, 5)
+        cart.remove_product(laptop)
+        self.assertEqual(cart.subtotal, 0)
+        self.assertEqual(cart.line_count, 0)
+
+    def test_subtotal_does_not_drift(self):
+        """
+        Checks the subtotal stays exact after adding and removing lines.
+        """
+
+        cart = ShoppingCart(check_consistency=True)
+        first = Product("Pen", 0.1)
+        second = Product("Pencil", 0.2)
+        cart.add_product(first)
+        cart.add_product(second)
+        cart.remove_product(first)
+        with patch("white_box.class_exercises.print") as mock_print:
+            cart.checkout()
+        mock_print.assert_any_call("Total: $0.2")
+        for _ in range(1000):
+            cart.add_product(first, 3)
+            cart.remove_product(first, 3)
+        self.assertEqual(cart.subtotal, 0.2)
+
+    def test_subtotal_follows_price_changes(self):
+        """
+        Checks a price changed while a product is in the cart is picked up by
+        the next change of its line.
+        """
+
+        cart = ShoppingCart(check_consistency=True)
+        product = Product("Pen", 10)
+        cart.add_product(product, 2)
+        product.price = 5
+        cart.remove_product(product)
+        with patch("white_box.class_exercises.print") as mock_print:
+            cart.checkout()
+        mock_print.assert_any_call("Total: $5")
+
+    def test_consistency_check_detects_stale_subtotal(self):
+        """
+        Checks the consistency mode fails when a price changes behind a line
+        that has not changed since.
+        """
+
+        cart = ShoppingCart(check_consistency=True)
+        product = Product("Laptop", 999.99)
+        cart.add_product(product, 1)
+        product.price = 10
+        with self.assertRaises(AssertionError):
+            cart.add_product(Product("Mouse", 49.99), 1)
+
     def test_view_cart(self):
         """
         Checks the shopping cart details are correct.
@@ -958,7 +1085,6 @@ class TestValidateCreditCard(unittest.TestCase):
 class TestValidateDate(unittest.TestCase):
     """
     Validate date unit tests.
-    For this exercise, we are not considering unexisting dates like February 30, etc.
     """
 
     def test_validate_date_out_of_range_day(self):
@@ -981,3 +1107,51 @@ class TestValidateDate(unittest.TestCase):
         """
 
         self.assertEqual(validate_date(1899, 1, 1), "Invalid Date")
+
+    def test_validate_date_month_length(self):
+        """
+        Validates error message for a day past the end of a short month.
+        """
+
+        self.assertEqual(validate_date(2023, 4, 31), "Invalid Date")
+        self.assertEqual(validate_date(2023, 2, 30), "Invalid Date")
+
+    def test_validate_date_leap_years(self):
+        """
+        Validates February 29 on leap and common years.
+        """
+
+        self.assertEqual(validate_date(2000, 2, 29), "Valid Date")
+        self.assertEqual(validate_date(2024, 2, 29), "Valid Date")
+        self.assertEqual(validate_date(1900, 2, 29), "Invalid Date")
+        self.assertEqual(validate_date(2100, 2, 29), "Invalid Date")
+
+    def test_validate_date_matches_is_valid_date(self):
+        """
+        Validates every day number of every month like is_valid_date.
+        """
+
+        for year in (1900, 2023, 2024):
+            for month in range(0, 14):
+                for day in range(0, 33):
+                    self.assertEqual(
+                        validate_date(year, month, day) == "Valid Date",
+                        is_valid_date(year, month, day),
+                    )
+
+    def test_validate_date_float_values(self):
+        """
+        Validates dates given as integer-valued floats.
+        """
+
+        self.assertEqual(validate_date(2024.0, 1, 1), "Valid Date")
+        self.assertEqual(validate_date(2024, 2.0, 29), "Valid Date")
+        self.assertEqual(validate_date(2023, 2.0, 29.0), "Invalid Date")
+
+    def test_validate_date_success(self):
+        """
+        Validates success message for the range boundaries.
+        """
+
+        self.assertEqual(validate_date(1900, 1, 1), "Valid Date")
+        self.assertEqual(validate_date(2100, 12, 31), "Valid Date")
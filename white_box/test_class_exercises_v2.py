@@ -79,8 +79,7 @@ class TestCheckFlightEligibility(unittest.TestCase):
 class TestValidateURL(unittest.TestCase):
     """
     Validate URL unit tests.
-    For this exercise, we are considering a URL that starts with http:// should be at maximum
-    255 characters long, and a URL that starts with https:// should not have an exceeding length.
+    URLs starting with http:// or https:// should be at maximum 255 characters long.
     """
 
     def test_url_too_long(self):
@@ -109,6 +108,31 @@ class TestValidateURL(unittest.TestCase):
 
         self.assertEqual(validate_url("https://example.com"), "Valid URL")
 
+    def test_url_starting_https_too_long(self):
+        """
+        Validates failed case for URL starting with https:// that is too long.
+        """
+
+        self.assertEqual(
+            validate_url("https://example.com/" + "a" * 236), "Invalid URL"
+        )
+        self.assertEqual(validate_url("https://example.com/" + "a" * 235), "Valid URL")
+
+    def test_url_invalid_scheme(self):
+        """
+        Validates failed case for URL with another scheme.
+        """
+
+        self.assertEqual(validate_url("ftp://example.com"), "Invalid URL")
+
+    def test_url_without_host(self):
+        """
+        Validates failed case for URL without a host.
+        """
+
+        self.assertEqual(validate_url("https://"), "Invalid URL")
+        self.assertEqual(validate_url("https://exa mple.com"), "Invalid URL")
+
 
 class TestCalculateQuantityDiscount(unittest.TestCase):
     """
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+Batch loan scoring unit testing examples.
+"""
+import io
+import os
+import tempfile
+import unittest
+from itertools import product
+
+from white_box.class_exercises import check_loan_eligibility
+from white_box.loan_scoring import (
+    LOAN_CATEGORIES,
+    category_counts,
+    score_applications,
+    score_file,
+)
+
+INCOMES = [0, 29999, 30000, 45000, 60000, 60000.5, 60001, 100000]
+CREDIT_SCORES = [0, 700, 700.5, 701, 750, 751, 850]
+
+
+class TestLoanScoring(unittest.TestCase):
+    """
+    Batch loan scoring unittest class.
+    """
+
+    def setUp(self):
+        """
+        Builds the applications of the income and credit score grid.
+        """
+        applications = list(product(INCOMES, CREDIT_SCORES))
+        self.incomes = [income for income, _ in applications]
+        self.credit_scores = [score for _, score in applications]
+        self.expected = [
+            check_loan_eligibility(*application) for application in applications
+        ]
+
+    def write_csv(self, directory):
+        """
+        Writes the applications to a CSV file and returns its path.
+        """
+        path = os.path.join(directory, "applications.csv")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("id,credit_score,income\n")
+            for number, (income, score) in enumerate(
+                zip(self.incomes, self.credit_scores)
+            ):
+                file.write(f"{number},{score},{income}\n")
+        return path
+
+    def test_matches_scalar_function(self):
+        """
+        Checks the codes give the check_loan_eligibility categories.
+        """
+        codes = score_applications(self.incomes, self.credit_scores)
+        self.assertEqual(codes.typecode, "b")
+        self.assertEqual([LOAN_CATEGORIES[code] for code in codes], self.expected)
+
+    def test_category_counts(self):
+        """
+        Checks the counts of every category, including empty ones.
+        """
+        codes = score_applications([10000, 40000, 40000, 70000], [800, 650, 720, 720])
+        self.assertEqual(
+            category_counts(codes),
+            {
+                "Not Eligible": 1,
+                "Secured Loan": 1,
+                "Standard Loan": 2,
+                "Premium Loan": 0,
+            },
+        )
+
+    def test_score_file(self):
+        """
+        Checks a file scored in small ranges, in process and on a pool.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write_csv(directory)
+            scores = score_file(path, chunk_bytes=64)
+            self.assertEqual(
+                [LOAN_CATEGORIES[code] for code in scores.codes], self.expected
+            )
+            self.assertEqual(
+                scores.counts,
+                {
+                    category: self.expected.count(category)
+                    for category in LOAN_CATEGORIES
+                },
+            )
+            output = io.BytesIO()
+            pooled = score_file(path, output, workers=2, chunk_bytes=64)
+        self.assertIsNone(pooled.codes)
+        self.assertEqual(output.getvalue(), scores.codes.tobytes())
+        self.assertEqual(pooled.counts, scores.counts)
+
+    def test_quoted_fields_and_byte_order_mark(self):
+        """
+        Checks quoted fields holding commas and a UTF-8 byte order mark.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "applications.csv")
+            with open(path, "w", encoding="utf-8-sig") as file:
+                file.write("income,name,credit_score\n")
+                file.write('70000,"Doe, Jane",760\n')
+                file.write('\n40000,"Roe, ""Rick""",650\n')
+            scores = score_file(path, chunk_bytes=8)
+        self.assertEqual(
+            [LOAN_CATEGORIES[code] for code in scores.codes],
+            ["Premium Loan", "Secured Loan"],
+        )
+
+    def test_missing_columns(self):
+        """
+        Checks a file without the income column raises ValueError.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "applications.csv")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("credit_score\n700\n")
+            with self.assertRaises(ValueError):
+                score_file(path)
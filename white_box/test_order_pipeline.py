@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+Streaming order processing unit testing examples.
+"""
+import io
+import json
+import unittest
+
+from white_box.order_pipeline import (
+    compose,
+    discount_orders,
+    price_orders,
+    process_orders,
+    read_orders_csv,
+    ship_orders,
+)
+
+
+class TestOrderPipeline(unittest.TestCase):
+    """
+    Streaming order processing unittest class.
+    """
+
+    def test_process_jsonl(self):
+        """
+        Checks a JSON Lines order log is priced, discounted and shipped.
+        """
+        orders = [
+            {"id": 1, "items": [{"quantity": 10, "price": 20, "weight": 6}]},
+            {
+                "id": 2,
+                "shipping_method": "express",
+                "items": [{"quantity": 1, "price": 50, "weight": 2}],
+            },
+        ]
+        source = io.StringIO("".join(json.dumps(order) + "\n" for order in orders))
+        sink = io.StringIO()
+        self.assertEqual(process_orders(source, sink), 2)
+        self.assertEqual(
+            [json.loads(line) for line in sink.getvalue().splitlines()],
+            [
+                {"id": 1, "total": 190.0, "discount": 19.0, "shipping": 15},
+                {"id": 2, "total": 50, "discount": 0, "shipping": 20},
+            ],
+        )
+
+    def test_process_csv(self):
+        """
+        Checks consecutive CSV rows are grouped into orders.
+        """
+        source = io.StringIO(
+            "id,quantity,price,weight,shipping_method\n"
+            "a,1,10,1,standard\n"
+            "a,2,10,1,standard\n"
+            "b,1,5,11,express\n"
+        )
+        sink = io.StringIO()
+        self.assertEqual(process_orders(source, sink, "csv"), 2)
+        results = [json.loads(line) for line in sink.getvalue().splitlines()]
+        self.assertEqual([r["total"] for r in results], [30.0, 5.0])
+        self.assertEqual([r["shipping"] for r in results], [10, 40])
+
+    def test_invalid_format(self):
+        """
+        Checks an unknown format raises ValueError.
+        """
+        with self.assertRaises(ValueError):
+            process_orders(io.StringIO(""), io.StringIO(), "xml")
+
+    def test_stages_are_lazy(self):
+        """
+        Checks the stages pull one order at a time from the source.
+        """
+        pulled = []
+
+        def source():
+            for number in range(3):
+                pulled.append(number)
+                yield {"id": number, "items": [{"quantity": 1, "price": 1}]}
+
+        stream = compose(source(), price_orders, discount_orders)
+        next(stream)
+        self.assertEqual(pulled, [0])
+
+    def test_ship_orders_default_method(self):
+        """
+        Checks the default shipping method is used when none is given.
+        """
+        orders = [{"items": [{"weight": 1}], "shipping_method": ""}]
+        shipped = list(ship_orders(orders, default_method="express"))
+        self.assertEqual(shipped[0]["shipping"], 20)
+
+    def test_read_orders_csv_empty(self):
+        """
+        Checks a CSV file with only a header has no orders.
+        """
+        source = io.StringIO("id,quantity,price,weight,shipping_method\n")
+        self.assertEqual(list(read_orders_csv(source)), [])
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""
+Batch order pricing unit testing examples.
+"""
+import random
+import unittest
+from array import array
+from unittest.mock import patch
+
+from white_box.class_exercises import calculate_order_total, calculate_total_discount
+from white_box.order_pricing import (
+    calculate_line_amounts,
+    calculate_order_totals,
+    orders_to_columns,
+    price_orders_parallel,
+    quantity_discount_factor,
+)
+
+
+class TestOrderPricing(unittest.TestCase):
+    """
+    Batch order pricing unittest class.
+    """
+
+    def test_orders_to_columns(self):
+        """
+        Checks the orders are flattened into columns and offsets.
+        """
+        quantities, prices, offsets = orders_to_columns(
+            [[{"quantity": 2, "price": 1.5}], [], [{"quantity": 7, "price": 3}] * 2]
+        )
+        self.assertEqual(list(quantities), [2, 7, 7])
+        self.assertEqual(list(prices), [1.5, 3.0, 3.0])
+        self.assertEqual(list(offsets), [0, 1, 1, 3])
+
+    def test_line_amounts_tiers(self):
+        """
+        Checks every quantity tier, including the boundaries.
+        """
+        quantities = [0, 1, 5, 6, 10, 11]
+        amounts = calculate_line_amounts(quantities, [10.0] * 6)
+        self.assertEqual(
+            list(amounts),
+            [
+                calculate_order_total([{"quantity": quantity, "price": 10.0}])
+                for quantity in quantities
+            ],
+        )
+        self.assertAlmostEqual(amounts[3], 57.0)
+
+    def test_quantity_discount_factor(self):
+        """
+        Checks the factors follow the 1-5 / 6-10 / 11+ quantity tiers.
+        """
+        self.assertEqual(
+            [quantity_discount_factor(q) for q in (0, 1, 5, 6, 10, 11)],
+            [0.9, 1.0, 1.0, 0.95, 0.95, 0.9],
+        )
+
+    def test_order_totals_match_scalar_function(self):
+        """
+        Checks the batch totals are identical to calculate_order_total.
+        """
+        generator = random.Random(42)
+        orders = [
+            [
+                {
+                    "quantity": generator.randint(0, 15),
+                    "price": round(generator.uniform(0.01, 500), 2),
+                }
+                for _ in range(generator.randint(0, 8))
+            ]
+            for _ in range(500)
+        ]
+        totals = calculate_order_totals(*orders_to_columns(orders))
+        self.assertEqual(list(totals), [calculate_order_total(o) for o in orders])
+
+    def test_order_totals_accept_array_buffers(self):
+        """
+        Checks array buffers are accepted as inputs.
+        """
+        totals = calculate_order_totals(
+            array("q", [1, 6]), array("d", [2.0, 10.0]), array("q", [0, 2])
+        )
+        self.assertAlmostEqual(totals[0], 59.0)
+
+
+class TestParallelOrderPricing(unittest.TestCase):
+    """
+    Multi-process order pricing unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates a batch of random orders.
+        """
+        generator = random.Random(7)
+        self.orders = [
+            [
+                {
+                    "quantity": generator.randint(1, 15),
+                    "price": generator.randint(1, 90),
+                }
+                for _ in range(generator.randint(0, 5))
+            ]
+            for _ in range(250)
+        ]
+        self.columns = orders_to_columns(self.orders)
+        self.totals = [calculate_order_total(order) for order in self.orders]
+
+    def test_shards_match_scalar_functions(self):
+        """
+        Checks the sharded results match the scalar functions.
+        """
+        result = price_orders_parallel(*self.columns, workers=2, chunk_size=40)
+        self.assertEqual(list(result.totals), self.totals)
+        self.assertEqual(
+            list(result.discounts), [calculate_total_discount(t) for t in self.totals]
+        )
+        self.assertAlmostEqual(result.total, sum(self.totals))
+        self.assertAlmostEqual(result.discount, sum(result.discounts))
+
+    def test_single_worker_runs_in_process(self):
+        """
+        Checks one worker, or a single shard, skips the process pool.
+        """
+        with patch("white_box.order_pricing.ProcessPoolExecutor") as mock_executor:
+            result = price_orders_parallel(*self.columns, workers=1, chunk_size=40)
+            price_orders_parallel(*self.columns)
+        mock_executor.assert_not_called()
+        self.assertEqual(list(result.totals), self.totals)
+
+    def test_no_orders(self):
+        """
+        Checks an empty order stream.
+        """
+        result = price_orders_parallel([], [], [0])
+        self.assertEqual((list(result.totals), result.total), ([], 0))
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""
+Rule table unit testing examples.
+"""
+import unittest
+
+from white_box.rule_tables import (
+    GRADE_TABLE,
+    LOAN_ELIGIBILITY_TABLE,
+    PRODUCT_CATEGORY_TABLE,
+    BandCounter,
+    RuleTable,
+)
+
+
+class TestRuleTable(unittest.TestCase):
+    """
+    Rule table unit tests.
+    """
+
+    def test_inclusive_and_exclusive_bounds(self):
+        """
+        Checks ">=" includes its bound and ">" excludes it.
+        """
+        table = RuleTable("low", [(">=", 10, "mid"), (">", 20, "high")])
+        self.assertEqual(
+            table.classify_many([9.9, 10, 20, 20.1]), ["low", "mid", "mid", "high"]
+        )
+        self.assertEqual([table.index(value) for value in (9, 10, 21)], [0, 1, 2])
+
+    def test_gaps_between_bands(self):
+        """
+        Checks a band can fall back to an earlier label, leaving a gap.
+        """
+        table = RuleTable("out", [(">=", 1, "in"), (">", 5, "out"), (">=", 6, "in")])
+        self.assertEqual(
+            table.classify_many([0, 1, 5, 5.5, 6]), ["out", "in", "in", "out", "in"]
+        )
+
+    def test_nested_tables(self):
+        """
+        Checks nested tables classify the following values.
+        """
+        self.assertEqual(
+            LOAN_ELIGIBILITY_TABLE.classify_many(
+                [20000, 30000, 60000, 60001, 60001],
+                [800, 701, 700, 751, 750],
+            ),
+            [
+                "Not Eligible",
+                "Standard Loan",
+                "Secured Loan",
+                "Premium Loan",
+                "Standard Loan",
+            ],
+        )
+
+    def test_batch_grades(self):
+        """
+        Checks a batch of scores.
+        """
+        self.assertEqual(
+            GRADE_TABLE.classify_many([100, 89.9, 70, 69]), ["A", "B", "C", "F"]
+        )
+
+    def test_invalid_steps(self):
+        """
+        Checks unknown operators and unsorted steps raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            RuleTable("low", [("<", 10, "high")])
+        with self.assertRaises(ValueError):
+            RuleTable("low", [(">", 10, "mid"), (">=", 10, "high")])
+
+
+class TestBandCounter(unittest.TestCase):
+    """
+    Band counter unit tests.
+    """
+
+    def test_counts_follow_price_changes(self):
+        """
+        Checks the category counts as product prices are set and changed.
+        """
+        counter = BandCounter(PRODUCT_CATEGORY_TABLE)
+        prices = {"pen": 5, "book": 50.5, "lamp": 100.99, "chair": 150}
+        for product, price in prices.items():
+            counter.set(product, price)
+        self.assertEqual(
+            counter.counts,
+            {"Category D": 1, "Category A": 1, "Category B": 1, "Category C": 1},
+        )
+        self.assertEqual(counter.set("book", 60), "Category B")
+        self.assertEqual(counter.set("book", 70), "Category B")
+        counter.remove("pen")
+        self.assertEqual(counter.label("lamp"), "Category B")
+        self.assertEqual(+counter.counts, {"Category B": 2, "Category C": 1})
+
+    def test_batch_price_classification(self):
+        """
+        Checks a batch of float prices has no gaps between bands.
+        """
+        self.assertEqual(
+            PRODUCT_CATEGORY_TABLE.classify_many([9.5, 10, 50.5, 100.99, 200.5, 201]),
+            [
+                "Category D",
+                "Category A",
+                "Category A",
+                "Category B",
+                "Category C",
+                "Category D",
+            ],
+        )
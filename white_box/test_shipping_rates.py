@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shipping rate table unit testing examples.
+"""
+import json
+import os
+import tempfile
+import unittest
+from itertools import product
+
+from white_box.class_exercises import (
+    calculate_items_shipping_cost,
+    calculate_shipping_cost,
+)
+from white_box.shipping_rates import DEFAULT_RATES, RateTable, ShippingMethod
+
+
+class TestRateTable(unittest.TestCase):
+    """
+    Shipping rate table unittest class.
+    """
+
+    def setUp(self):
+        """
+        Compiles the default rate table.
+        """
+        self.rates = RateTable()
+
+    def test_items_cost_matches_scalar_function(self):
+        """
+        Checks the default table prices items like the scalar function.
+        """
+        for weight, method in product(
+            [0, 4.9, 5, 5.1, 10, 10.1, 50], ["standard", "express"]
+        ):
+            items = [{"weight": weight / 2}, {"weight": weight / 2}]
+            self.assertEqual(
+                self.rates.items_cost(items, method),
+                calculate_items_shipping_cost(items, method),
+            )
+
+    def test_parcel_cost_matches_scalar_function(self):
+        """
+        Checks the default table prices parcels like the scalar function.
+        """
+        weights = [0, 1, 1.5, 5, 5.5]
+        sizes = [-1, 10, 10.5, 11, 30, 31]
+        for parcel in product(weights, sizes, sizes, sizes):
+            self.assertEqual(
+                self.rates.parcel_cost(*parcel), calculate_shipping_cost(*parcel)
+            )
+
+    def test_batch_costs(self):
+        """
+        Checks the batch APIs price every parcel.
+        """
+        self.assertEqual(
+            self.rates.weight_costs([1, 6, 11], ShippingMethod.EXPRESS), [20, 30, 40]
+        )
+        self.assertEqual(
+            self.rates.parcel_costs([1, 3, 3], [5, 20, 40], [5, 20, 20], [5, 20, 20]),
+            [5, 10, 20],
+        )
+
+    def test_invalid_shipping_method(self):
+        """
+        Checks unknown methods raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            self.rates.items_cost([{"weight": 1}], "overnight")
+        with self.assertRaises(ValueError):
+            self.rates.weight_cost(1, None)
+        only_standard = RateTable(
+            {
+                "methods": {"standard": DEFAULT_RATES["methods"]["standard"]},
+                "parcel": DEFAULT_RATES["parcel"],
+            }
+        )
+        with self.assertRaises(ValueError):
+            only_standard.weight_cost(1, "express")
+        with self.assertRaises(ValueError):
+            only_standard.weight_costs([1], "express")
+
+    def test_invalid_costs(self):
+        """
+        Checks a method needs one more cost than weight limits.
+        """
+        config = json.loads(json.dumps(DEFAULT_RATES))
+        config["methods"]["standard"]["costs"] = [10, 15]
+        with self.assertRaises(ValueError):
+            RateTable(config)
+
+    def test_config_method(self):
+        """
+        Checks a method only defined in the config is priced by name.
+        """
+        config = json.loads(json.dumps(DEFAULT_RATES))
+        config["methods"]["overnight"] = {"weight_limits": [5], "costs": [50, 80]}
+        rates = RateTable(config)
+        self.assertEqual(rates.methods, ["standard", "express", "overnight"])
+        self.assertEqual(rates.weight_costs([5, 6], "overnight"), [50, 80])
+        self.assertEqual(rates.weight_cost(6, ShippingMethod.EXPRESS), 30)
+
+    def test_open_dimension_band(self):
+        """
+        Checks a None upper bound leaves the last dimension band open.
+        """
+        config = json.loads(json.dumps(DEFAULT_RATES))
+        config["parcel"]["dimension_bands"] = [[None, 10], [11, None]]
+        rates = RateTable(config)
+        self.assertEqual(rates.parcel_cost(3, 40, 40, 40), 10)
+        self.assertEqual(rates.parcel_cost(1, 5, 5, 5), 5)
+        self.assertEqual(rates.parcel_cost(3, 5, 40, 40), 20)
+
+    def test_unsorted_weight_limits(self):
+        """
+        Checks weight limits out of ascending order are rejected.
+        """
+        for limits in ([10, 5], [5, 5]):
+            config = json.loads(json.dumps(DEFAULT_RATES))
+            config["methods"]["standard"]["weight_limits"] = limits
+            with self.assertRaises(ValueError):
+                RateTable(config)
+        config = json.loads(json.dumps(DEFAULT_RATES))
+        config["parcel"]["weight_limits"] = [5, 1]
+        with self.assertRaises(ValueError):
+            RateTable(config)
+
+    def test_from_file(self):
+        """
+        Checks a rate table loaded from a JSON file.
+        """
+        config = json.loads(json.dumps(DEFAULT_RATES))
+        config["methods"]["standard"] = {"weight_limits": [2], "costs": [7, 9]}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rates.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(config, file)
+            rates = RateTable.from_file(path)
+        self.assertEqual(rates.weight_costs([2, 2.5], "standard"), [7, 9])
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+
+"""
+Validation engine unit testing examples.
+"""
+import datetime
+import os
+import re
+import tempfile
+import unittest
+from urllib.parse import urlsplit
+
+from white_box.validators import (
+    BIN_INDEX,
+    BinIndex,
+    EmailValidator,
+    check_credit_card,
+    check_password,
+    is_valid_date,
+    luhn_valid,
+    parse_url,
+    validate_card_batch,
+    validate_dates,
+    validate_urls,
+)
+
+
+class TestCheckPassword(unittest.TestCase):
+    """
+    Single-pass password validator unit tests.
+    """
+
+    def test_valid_password(self):
+        """
+        Checks a password meeting every rule.
+        """
+        self.assertEqual(check_password("Secret#123"), [])
+
+    def test_reports_every_failed_rule(self):
+        """
+        Checks all the failed rules are reported at once.
+        """
+        self.assertEqual(
+            check_password("abc"), ["length", "uppercase", "digit", "special"]
+        )
+        self.assertEqual(check_password("ABCDEFGH"), ["lowercase", "digit", "special"])
+
+    def test_unicode_digits_and_letters(self):
+        """
+        Checks Unicode digits count like \\d and non-ASCII letters do not.
+        """
+        self.assertEqual(check_password("Secret#١٢٣"), [])
+        self.assertEqual(check_password("ÉCRIT#123"), ["lowercase"])
+
+    def test_matches_regular_expressions(self):
+        """
+        Checks the rules agree with the regular expressions they replace.
+        """
+        patterns = {
+            "uppercase": r"[A-Z]",
+            "lowercase": r"[a-z]",
+            "digit": r"\d",
+            "special": r"[!@#$%&]",
+        }
+        for password in ["", "aA1!", "Pass word 9 &", "ñÑ٣*", "Zz0@Zz0@"]:
+            expected = [] if len(password) >= 8 else ["length"]
+            expected += [
+                rule
+                for rule, pattern in patterns.items()
+                if not re.search(pattern, password)
+            ]
+            self.assertEqual(check_password(password), expected)
+
+
+class TestCreditCardEngine(unittest.TestCase):
+    """
+    Luhn and BIN credit card engine unit tests.
+    """
+
+    def test_luhn_valid(self):
+        """
+        Checks the Luhn checksum on known test numbers, as str and bytes.
+        """
+        self.assertTrue(luhn_valid("4111111111111111"))
+        self.assertTrue(luhn_valid(b"378282246310005"))
+        self.assertFalse(luhn_valid("4111111111111112"))
+        self.assertFalse(luhn_valid(""))
+        self.assertFalse(luhn_valid(b""))
+
+    def test_luhn_matches_reference(self):
+        """
+        Checks the table-driven checksum against the textbook algorithm.
+        """
+        for number in range(1000000000000, 1000000000200):
+            digits = [int(digit) for digit in str(number)][::-1]
+            total = sum(digits[0::2]) + sum(
+                sum(divmod(2 * d, 10)) for d in digits[1::2]
+            )
+            self.assertEqual(luhn_valid(str(number)), total % 10 == 0)
+
+    def test_check_credit_card(self):
+        """
+        Checks the failed rules reported for several numbers.
+        """
+        self.assertEqual(check_credit_card("4111111111111111"), [])
+        self.assertEqual(check_credit_card("4111111111111112"), ["checksum"])
+        self.assertEqual(check_credit_card("4111"), ["length", "checksum"])
+        self.assertEqual(check_credit_card("41111111111a1111"), ["digits"])
+        self.assertEqual(check_credit_card("٤١١١١١١١١١١١١١١١"), ["digits"])
+
+    def test_bin_lookup(self):
+        """
+        Checks the network lookup by longest prefix.
+        """
+        self.assertEqual(BIN_INDEX.lookup("4111111111111111"), "Visa")
+        self.assertEqual(BIN_INDEX.lookup("2221000000000009"), "Mastercard")
+        self.assertEqual(BIN_INDEX.lookup("6011000990139424"), "Discover")
+        self.assertEqual(BIN_INDEX.lookup(b"3530111333300000"), "JCB")
+        self.assertIsNone(BIN_INDEX.lookup("9111111111111111"))
+
+    def test_custom_bin_index(self):
+        """
+        Checks a more specific prefix overrides a shorter one.
+        """
+        index = BinIndex({"Visa": ["4"], "Visa Electron": ["4026"]})
+        self.assertEqual(index.lookup("4026000000000002"), "Visa Electron")
+        self.assertEqual(index.lookup("4020000000000002"), "Visa")
+
+    def test_validate_card_batch(self):
+        """
+        Checks batches given as a bytes buffer or as an iterable.
+        """
+        buffer = b"4111111111111111\n4111111111111112\n378282246310005\n12\n"
+        self.assertEqual(validate_card_batch(buffer), bytearray([1, 0, 1, 0]))
+        self.assertEqual(
+            validate_card_batch(["5555555555554444", "5555 5555 5555 4444"]),
+            bytearray([1, 0]),
+        )
+
+    def test_validate_card_batch_blank_entries(self):
+        """
+        Checks blank buffer lines are skipped and empty entries are invalid.
+        """
+        buffer = b"\n4111111111111111\n\r\n   \n12\n"
+        self.assertEqual(validate_card_batch(buffer), bytearray([1, 0]))
+        self.assertEqual(validate_card_batch(["", b""]), bytearray([0, 0]))
+
+
+class TestDateEngine(unittest.TestCase):
+    """
+    Calendar-aware date engine unit tests.
+    """
+
+    def test_matches_datetime(self):
+        """
+        Checks every day number of every month against datetime.
+        """
+        for year in (1900, 1999, 2000, 2023, 2024, 2100):
+            for month in range(1, 13):
+                for day in range(0, 33):
+                    try:
+                        datetime.date(year, month, day)
+                        expected = True
+                    except ValueError:
+                        expected = False
+                    self.assertEqual(is_valid_date(year, month, day), expected)
+
+    def test_out_of_range(self):
+        """
+        Checks years and months outside the table are invalid.
+        """
+        self.assertFalse(is_valid_date(1899, 12, 31))
+        self.assertFalse(is_valid_date(2101, 1, 1))
+        self.assertFalse(is_valid_date(2000, 0, 1))
+        self.assertFalse(is_valid_date(2000, 13, 1))
+
+    def test_float_values(self):
+        """
+        Checks integer-valued floats are valid dates and other floats do not
+        raise.
+        """
+        self.assertTrue(is_valid_date(2024.0, 1, 1))
+        self.assertTrue(is_valid_date(2024, 2.0, 29.0))
+        self.assertFalse(is_valid_date(2023.0, 2.0, 29))
+        self.assertFalse(is_valid_date(2024, 2.5, 31))
+        self.assertEqual(
+            validate_dates([2024.0, 2023.0], [2.0, 4.0], [29, 31]), bytearray([1, 0])
+        )
+
+    def test_validate_dates(self):
+        """
+        Checks the bulk API over year, month and day columns.
+        """
+        self.assertEqual(
+            validate_dates([2024, 2023, 1899, 2000], [2, 2, 1, 12], [29, 29, 1, 31]),
+            bytearray([1, 0, 0, 1]),
+        )
+
+
+class TestUrlEngine(unittest.TestCase):
+    """
+    URL engine unit tests.
+    """
+
+    def test_parse_url(self):
+        """
+        Checks the structured result of a valid URL.
+        """
+        parsed = parse_url("HTTPS://Example.com:8443/path?q=1#top")
+        self.assertEqual(parsed.scheme, "https")
+        self.assertEqual(parsed.host, "example.com")
+        self.assertEqual(parsed.port, 8443)
+        self.assertEqual(parsed.path, "/path?q=1#top")
+        self.assertEqual(parse_url("http://localhost").path, "")
+
+    def test_invalid_urls(self):
+        """
+        Checks invalid schemes, hosts, ports and lengths.
+        """
+        for url in [
+            "https://",
+            "https://-example.com",
+            "https://example..com",
+            "https://example.com:0",
+            "https://example.com:65536",
+            "https://256.1.1.1",
+            "https://1.2.3",
+            "https://example.com/a b",
+            "mailto:user@example.com",
+            "https://" + "a" * 63 + ".com/" + "b" * 180,
+        ]:
+            self.assertIsNone(parse_url(url), url)
+
+    def test_ip_hosts(self):
+        """
+        Checks IPv4 and bracketed IPv6 hosts.
+        """
+        self.assertEqual(parse_url("http://192.168.0.1:80").host, "192.168.0.1")
+        self.assertEqual(parse_url("http://[::1]/").host, "[::1]")
+        self.assertEqual(parse_url("http://[2001:DB8::1]:8080").host, "[2001:db8::1]")
+        self.assertEqual(parse_url("http://[::ffff:1.2.3.4]").host, "[::ffff:1.2.3.4]")
+        for url in ["http://[:::]", "http://[1:2]", "http://[::1.2.3]", "http://[]"]:
+            self.assertIsNone(parse_url(url), url)
+
+    def test_agrees_with_urllib(self):
+        """
+        Checks the scanner agrees with urllib.parse on simple valid URLs.
+        """
+        for url in ["http://a.b.c:1/x", "https://example.com?x=y", "http://h#f"]:
+            expected = urlsplit(url)
+            parsed = parse_url(url)
+            self.assertEqual(
+                (parsed.scheme, parsed.host, parsed.port),
+                (expected.scheme, expected.hostname, expected.port),
+            )
+
+    def test_validate_urls(self):
+        """
+        Checks the batch mode.
+        """
+        self.assertEqual(
+            validate_urls(["https://example.com", "example.com"]), bytearray([1, 0])
+        )
+
+
+class TestEmailEngine(unittest.TestCase):
+    """
+    Email engine unit tests.
+    """
+
+    def setUp(self):
+        """
+        Creates a validator without allow or deny lists.
+        """
+        self.validator = EmailValidator()
+
+    def test_valid_addresses(self):
+        """
+        Checks addresses following the grammar, including IDNA domains.
+        """
+        for email in [
+            "user@example.com",
+            "first.last+tag@sub.example.co.uk",
+            "o'brien@example.org",
+            "user@bücher.de",
+            "user@xn--bcher-kva.de",
+        ]:
+            self.assertEqual(self.validator.check(email), [], email)
+
+    def test_invalid_addresses(self):
+        """
+        Checks the failed rules of invalid addresses.
+        """
+        self.assertEqual(
+            self.validator.check("userexample.com"), ["local part", "domain"]
+        )
+        self.assertEqual(self.validator.check("a..b@example.com"), ["local part"])
+        self.assertEqual(
+            self.validator.check("a" * 65 + "@example.com"), ["local part"]
+        )
+        self.assertEqual(self.validator.check("user@examplecom"), ["domain"])
+        self.assertEqual(self.validator.check("user@-example.com"), ["domain"])
+        self.assertEqual(self.validator.check("user@" + "a" * 64 + ".com"), ["domain"])
+        self.assertEqual(
+            self.validator.check("user@" + "a.b" * 90 + ".com"), ["length"]
+        )
+
+    def test_domain_checks_are_cached(self):
+        """
+        Checks each domain is checked once across many addresses.
+        """
+        emails = [f"user{number}@example.com" for number in range(100)]
+        self.assertEqual(self.validator.validate_many(emails), bytearray([1] * 100))
+        info = self.validator.check_domain.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 99))
+
+    def test_allow_and_deny_lists_from_files(self):
+        """
+        Checks the allow and deny lists, matching subdomains too.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            allowed_path = os.path.join(directory, "allowed.txt")
+            denied_path = os.path.join(directory, "denied.txt")
+            with open(allowed_path, "w", encoding="utf-8") as file:
+                file.write("# partners\nexample.com\n\nexample.org\n")
+            with open(denied_path, "w", encoding="utf-8") as file:
+                file.write("Spam.Example.com\n")
+            validator = EmailValidator.from_files(allowed_path, denied_path)
+        self.assertEqual(validator.check("user@mail.example.com"), [])
+        self.assertEqual(validator.check("user@spam.example.com"), ["denied"])
+        self.assertEqual(validator.check("user@example.net"), ["not allowed"])
+
+    def test_internationalized_listed_domains(self):
+        """
+        Checks listed domains match in their Unicode and IDNA forms alike.
+        """
+        denied = EmailValidator(denied=["bücher.de"])
+        self.assertEqual(denied.check("a@bücher.de"), ["denied"])
+        self.assertEqual(denied.check("a@xn--bcher-kva.de"), ["denied"])
+        allowed = EmailValidator(allowed=["xn--bcher-kva.de"])
+        self.assertEqual(allowed.check("a@shop.bücher.de"), [])
+        with self.assertRaises(ValueError):
+            EmailValidator(denied=["a..b"])
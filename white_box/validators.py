@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+
+"""
+Validation engines behind the input validation functions.
+"""
+import calendar
+import io
+import ipaddress
+import re
+import string
+from collections import namedtuple
+from functools import lru_cache
+
+PASSWORD_MIN_LENGTH = 8
+PASSWORD_UPPERCASE = frozenset(string.ascii_uppercase)
+PASSWORD_LOWERCASE = frozenset(string.ascii_lowercase)
+PASSWORD_SPECIAL = frozenset("!@#$%&")
+
+
+def check_password(password):
+    """
+    Returns the password rules that failed, in the order "length",
+    "uppercase", "lowercase", "digit" and "special". The characters are
+    scanned once to build their set; the class checks then run on it.
+    """
+    failed = []
+    if len(password) < PASSWORD_MIN_LENGTH:
+        failed.append("length")
+    characters = set(password)
+    if characters.isdisjoint(PASSWORD_UPPERCASE):
+        failed.append("uppercase")
+    if characters.isdisjoint(PASSWORD_LOWERCASE):
+        failed.append("lowercase")
+    # Like \d in re, any Unicode decimal digit counts.
+    if not any(map(str.isdecimal, characters)):
+        failed.append("digit")
+    if characters.isdisjoint(PASSWORD_SPECIAL):
+        failed.append("special")
+    return failed
+
+
+CARD_MIN_LENGTH = 13
+CARD_MAX_LENGTH = 16
+# Digit d of every second position from the right becomes 2 * d, minus 9
+# when that is above 9.
+LUHN_DOUBLE = bytes.maketrans(b"0123456789", b"0246813579")
+
+
+def _expand(first, last):
+    """Returns the prefixes of the numbers from first to last."""
+    return [str(number) for number in range(first, last + 1)]
+
+
+CARD_NETWORK_PREFIXES = {
+    "Visa": ["4"],
+    "Mastercard": _expand(51, 55) + _expand(2221, 2720),
+    "American Express": ["34", "37"],
+    "Discover": ["6011", "65"] + _expand(644, 649),
+    "Diners Club": ["36", "38"] + _expand(300, 305),
+    "JCB": _expand(3528, 3589),
+}
+
+
+class BinIndex:
+    """
+    Trie of card number prefixes (BIN/IIN) giving the card network. Lookups
+    follow the digits of the number and keep the longest matching prefix.
+    """
+
+    def __init__(self, prefixes=None):
+        """Builds the trie from a network to prefixes mapping."""
+        self._root = {}
+        prefixes = CARD_NETWORK_PREFIXES if prefixes is None else prefixes
+        for network, network_prefixes in prefixes.items():
+            for prefix in network_prefixes:
+                self.add(prefix, network)
+
+    def add(self, prefix, network):
+        """Registers a prefix for a network."""
+        node = self._root
+        for digit in prefix.encode("ascii"):
+            node = node.setdefault(digit, {})
+        node[None] = network
+
+    def lookup(self, number):
+        """Returns the network of a card number, or None."""
+        if isinstance(number, str):
+            number = number.encode("ascii", "replace")
+        network = None
+        node = self._root
+        for digit in number:
+            node = node.get(digit)
+            if node is None:
+                break
+            network = node.get(None, network)
+        return network
+
+
+BIN_INDEX = BinIndex()
+
+
+def luhn_valid(number):
+    """
+    Returns whether a string or bytes of ASCII digits passes the Luhn
+    checksum. The doubled digits are mapped with one translate table and
+    both digit sets are summed as bytes. An empty number is not valid.
+    """
+    if not number:
+        return False
+    if isinstance(number, str):
+        number = number.encode("ascii")
+    doubled = number[-2::-2].translate(LUHN_DOUBLE)
+    total = sum(number[-1::-2]) + sum(doubled) - ord("0") * len(number)
+    return total % 10 == 0
+
+
+def check_credit_card(number):
+    """
+    Returns the card rules that failed: "length", "digits" (ASCII digits
+    only) and "checksum" (Luhn, only checked on digits).
+    """
+    failed = []
+    if not CARD_MIN_LENGTH <= len(number) <= CARD_MAX_LENGTH:
+        failed.append("length")
+    if not (number.isascii() and number.isdigit()):
+        failed.append("digits")
+    elif not luhn_valid(number):
+        failed.append("checksum")
+    return failed
+
+
+def validate_card_batch(numbers):
+    """
+    Validates many card numbers: an iterable of str or bytes, or a bytes
+    buffer with one number per line. Returns a bytearray with 1 for each
+    valid number and 0 otherwise. Blank lines of a buffer are skipped, so
+    result i is the number on the i-th non-blank line; an empty entry of an
+    iterable is an invalid number.
+    """
+    if isinstance(numbers, (bytes, bytearray, memoryview)):
+        numbers = (line for line in io.BytesIO(numbers) if not line.isspace())
+    results = bytearray()
+    for number in numbers:
+        number = number.strip()
+        results.append(
+            CARD_MIN_LENGTH <= len(number) <= CARD_MAX_LENGTH
+            and number.isascii()
+            and number.isdigit()
+            and luhn_valid(number)
+        )
+    return results
+
+
+DATE_MIN_YEAR = 1900
+DATE_MAX_YEAR = 2100
+# Every month has at least 28 days and every month but February at least
+# 30, so only the 31st and February 29 need these sets. Integer-valued
+# floats hash like ints, so 2024.0 is found too.
+LONG_MONTHS = frozenset({1, 3, 5, 7, 8, 10, 12})
+LEAP_YEARS = frozenset(
+    year for year in range(DATE_MIN_YEAR, DATE_MAX_YEAR + 1) if calendar.isleap(year)
+)
+
+
+def is_valid_date(year, month, day):
+    """
+    Returns whether a date exists, taking month lengths and leap years into
+    account, within the DATE_MIN_YEAR to DATE_MAX_YEAR range.
+    """
+    if (
+        DATE_MIN_YEAR <= year <= DATE_MAX_YEAR
+        and 1 <= month <= 12
+        and (
+            1 <= day <= 28
+            or (28 < day <= 30 and month != 2)
+            or (day == 31 and month in LONG_MONTHS)
+            or (day == 29 and year in LEAP_YEARS)
+        )
+    ):
+        return True
+    return False
+
+
+def validate_dates(years, months, days):
+    """
+    Validates columns of years, months and days at once. Returns a bytearray
+    with 1 for each valid date and 0 otherwise.
+    """
+    return bytearray(map(is_valid_date, years, months, days))
+
+
+URL_MAX_LENGTH = 255
+_LABEL = r"[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?"
+URL_PATTERN = re.compile(
+    rf"""
+    (?P<scheme>https?)://
+    (?P<host>(?:{_LABEL}\.)*{_LABEL}|\[[0-9a-f:.]+\])
+    (?::(?P<port>[0-9]{{1,5}}))?
+    (?P<path>[/?#]\S*)?
+    """,
+    re.VERBOSE | re.IGNORECASE | re.ASCII,
+)
+ParsedUrl = namedtuple("ParsedUrl", ["scheme", "host", "port", "path"])
+
+
+def parse_url(url):
+    """
+    Parses an http or https URL of at most URL_MAX_LENGTH characters with one
+    precompiled scanner. Returns a ParsedUrl, with the scheme and host in
+    lower case, or None if the URL is invalid.
+    """
+    if len(url) > URL_MAX_LENGTH:
+        return None
+    match = URL_PATTERN.fullmatch(url)
+    if match is None:
+        return None
+    scheme, host, port, path = match.group("scheme", "host", "port", "path")
+    if port is not None:
+        port = int(port)
+        if not 1 <= port <= 65535:
+            return None
+    if host.startswith("["):
+        try:
+            ipaddress.IPv6Address(host[1:-1])
+        except ValueError:
+            return None
+        return ParsedUrl(scheme.lower(), host.lower(), port, path or "")
+    parts = host.split(".")
+    if all(part.isdigit() for part in parts) and (
+        len(parts) != 4 or any(int(part) > 255 for part in parts)
+    ):
+        # Numeric hosts must be dotted IPv4 addresses.
+        return None
+    return ParsedUrl(scheme.lower(), host.lower(), port, path or "")
+
+
+def validate_urls(urls):
+    """
+    Validates many URLs. Returns a bytearray with 1 for each valid URL and 0
+    otherwise.
+    """
+    return bytearray(parse_url(url) is not None for url in urls)
+
+
+EMAIL_MAX_LENGTH = 254
+EMAIL_LOCAL_MAX_LENGTH = 64
+EMAIL_LOCAL_PATTERN = re.compile(
+    r"[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*",
+    re.IGNORECASE | re.ASCII,
+)
+EMAIL_DOMAIN_PATTERN = re.compile(
+    rf"(?:{_LABEL}\.)+(?:[a-z]{{2,63}}|xn--[a-z0-9-]{{1,59}})",
+    re.IGNORECASE | re.ASCII,
+)
+
+
+def _read_domains(path):
+    """Reads one domain per line, skipping blank lines and # comments."""
+    with open(path, encoding="utf-8") as file:
+        return {
+            line.strip().lower()
+            for line in file
+            if line.strip() and not line.lstrip().startswith("#")
+        }
+
+
+def _ascii_domain(domain):
+    """
+    Returns a domain IDNA-encoded and in lower case, the form domains are
+    compared in. Raises UnicodeError when it cannot be encoded.
+    """
+    return domain.encode("idna").decode("ascii").lower()
+
+
+def _ascii_domains(domains):
+    """Returns the set of the ASCII forms of listed domains."""
+    try:
+        return {_ascii_domain(domain) for domain in domains}
+    except UnicodeError as error:
+        raise ValueError(f"Invalid listed domain: {error}") from error
+
+
+class EmailValidator:
+    """
+    Email address validator. The local part and the domain are checked
+    separately; domain checks (IDNA encoding, syntax, allow and deny lists)
+    are cached per domain, so they run once per domain, not per address.
+    """
+
+    def __init__(self, allowed=None, denied=None, cache_size=4096):
+        """
+        Creates a validator. allowed, when given, lists the only domains
+        accepted; denied lists refused domains. Subdomains of a listed domain
+        are matched too. Listed domains are IDNA-encoded like the checked
+        ones, so either form of an internationalized domain matches.
+        """
+        self.allowed = None if allowed is None else _ascii_domains(allowed)
+        self.denied = set() if denied is None else _ascii_domains(denied)
+        self.check_domain = lru_cache(maxsize=cache_size)(self._check_domain)
+
+    @classmethod
+    def from_files(cls, allowed_path=None, denied_path=None, cache_size=4096):
+        """Creates a validator with allow and deny lists read from files."""
+        return cls(
+            None if allowed_path is None else _read_domains(allowed_path),
+            None if denied_path is None else _read_domains(denied_path),
+            cache_size,
+        )
+
+    @staticmethod
+    def _listed(domain, domains):
+        """Returns whether a domain or one of its parents is in domains."""
+        labels = domain.split(".")
+        return any(".".join(labels[i:]) in domains for i in range(len(labels)))
+
+    def _check_domain(self, domain):
+        """Returns the domain rule that failed, or None."""
+        try:
+            ascii_domain = _ascii_domain(domain)
+        except UnicodeError:
+            return "domain"
+        if not EMAIL_DOMAIN_PATTERN.fullmatch(ascii_domain):
+            return "domain"
+        if self._listed(ascii_domain, self.denied):
+            return "denied"
+        if self.allowed is not None and not self._listed(ascii_domain, self.allowed):
+            return "not allowed"
+        return None
+
+    def check(self, email):
+        """
+        Returns the rules that failed: "length", "local part", then one of
+        "domain", "denied" or "not allowed".
+        """
+        failed = []
+        if len(email) > EMAIL_MAX_LENGTH:
+            failed.append("length")
+        local, separator, domain = email.rpartition("@")
+        if not separator:
+            domain = ""
+        if (
+            not separator
+            or len(local) > EMAIL_LOCAL_MAX_LENGTH
+            or not EMAIL_LOCAL_PATTERN.fullmatch(local)
+        ):
+            failed.append("local part")
+        domain_failure = self.check_domain(domain)
+        if domain_failure is not None:
+            failed.append(domain_failure)
+        return failed
+
+    def validate_many(self, emails):
+        """
+        Validates many addresses. Returns a bytearray with 1 for each valid
+        address and 0 otherwise.
+        """
+        return bytearray(not self.check(email) for email in emails)